@@ -6,9 +6,19 @@ Discovers symbols from data/<SYMBOL>/paper_state.db and reads positions, cash, j
 import json
 import os
 import sqlite3
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _ts_iso(value: Any) -> str:
+    """Paper state stores epoch microseconds (older DBs: ISO text); return ISO UTC."""
+    if isinstance(value, int):
+        return (_EPOCH + timedelta(microseconds=value)).isoformat()
+    return value or ""
+
 
 def _data_dir() -> Path:
     """Base data dir: repo root / data, or VPA_DASHBOARD_DATA_DIR if set."""
@@ -84,7 +94,7 @@ def get_recent_fills(symbol: str, limit: int = 20, data_dir: Path | None = None)
                     "side": r[3],
                     "qty": r[4],
                     "price": r[5],
-                    "ts_utc": r[6],
+                    "ts_utc": _ts_iso(r[6]),
                 }
                 for r in rows
             ]
@@ -18,9 +18,10 @@ from vpa_core.contracts import (
     TradeIntent,
     TradeIntentStatus,
 )
-from vpa_core.context_engine import analyze as analyze_context
+from vpa_core.atr import ATRState
+from vpa_core.context_engine import ContextTracker
 from vpa_core.daily_context import compute_daily_context
-from vpa_core.pipeline import PipelineResult, run_pipeline
+from vpa_core.pipeline import PipelineResult, history_needed, run_pipeline
 from vpa_core.risk_engine import AccountState
 from vpa_core.setup_composer import SetupComposer
 
@@ -138,14 +139,19 @@ def run_backtest(
     cash = initial_cash
     daily_pnl = 0.0
     composer = SetupComposer(config)
+    context_tracker = ContextTracker(config, timeframe)
     position: _OpenPosition | None = None
     pending_intent: TradeIntent | None = None
     trades: list[BacktestTrade] = []
     pipeline_events: list[PipelineResult] = []
+    atr_state = ATRState(config.atr.period) if config.atr.enabled else None
+    window = history_needed(config)
 
     for i in range(len(bars)):
-        current_bars = bars[: i + 1]
+        current_bars = bars[max(0, i + 1 - window) : i + 1]
         current_bar = bars[i]
+        context_tracker.update(current_bar)
+        atr_value = atr_state.update(current_bar) if atr_state is not None else None
 
         # --- Execute pending intent at this bar's open (next-bar execution) ---
         if pending_intent is not None and position is None:
@@ -223,7 +229,7 @@ def run_backtest(
             open_position_count=open_count,
             daily_realized_pnl=daily_pnl,
         )
-        context = analyze_context(current_bars, config, timeframe)
+        context = context_tracker.snapshot()
 
         result = run_pipeline(
             bars=current_bars,
@@ -234,6 +240,7 @@ def run_backtest(
             composer=composer,
             tf=timeframe,
             daily_context=daily_context,
+            atr_value=atr_value,
         )
         pipeline_events.append(result)
 
@@ -120,15 +120,16 @@ def backtest(ctx: click.Context, start_str: str | None, end_str: str | None) ->
                 journal.signal(intent.setup, intent.direction, " -> ".join(intent.rationale), intent.setup)
 
     click.echo(f"Running backtest: {cfg.symbol} {cfg.timeframe}, {len(bars)} bars ...")
-    result = run_backtest(
-        bars,
-        cfg.symbol,
-        cfg.timeframe,
-        initial_cash=cfg.backtest.initial_cash,
-        slippage_bps=cfg.backtest.slippage_bps,
-        journal_callback=on_event,
-        daily_bars=daily_bars or None,
-    )
+    with journal:
+        result = run_backtest(
+            bars,
+            cfg.symbol,
+            cfg.timeframe,
+            initial_cash=cfg.backtest.initial_cash,
+            slippage_bps=cfg.backtest.slippage_bps,
+            journal_callback=on_event,
+            daily_bars=daily_bars or None,
+        )
     click.echo(format_backtest_summary(result))
 
 
@@ -238,19 +239,19 @@ def paper(ctx: click.Context, window: int, live: bool) -> None:
         max_position_pct=cfg.execution.max_position_pct,
         max_cash_per_trade_pct=cfg.execution.max_cash_per_trade_pct,
         initial_cash=cfg.execution.initial_cash,
+        uuid_ids=cfg.execution.uuid_ids,
     )
-    journal = JournalWriter(cfg.journal.path, echo_stdout=cfg.journal.echo_stdout)
-
-    for intent in ready_intents:
-        order = executor.submit_intent(cfg.symbol, intent, bars[-1].close)
-        if order:
-            rationale_str = " -> ".join(intent.rationale)
-            journal.signal(intent.setup, intent.direction, rationale_str, intent.setup)
-            click.echo(f"\n  Paper order submitted: {order.side} {order.qty} {order.symbol} @ market")
-            click.echo(f"  Setup: {intent.setup}  Stop: {intent.risk_plan.stop:.2f}")
-        else:
-            click.echo(f"\n  Order rejected (risk limit or existing position for {cfg.symbol}).")
-        break  # single position
+    with JournalWriter(cfg.journal.path, echo_stdout=cfg.journal.echo_stdout) as journal:
+        for intent in ready_intents:
+            order = executor.submit_intent(cfg.symbol, intent, bars[-1].close)
+            if order:
+                rationale_str = " -> ".join(intent.rationale)
+                journal.signal(intent.setup, intent.direction, rationale_str, intent.setup)
+                click.echo(f"\n  Paper order submitted: {order.side} {order.qty} {order.symbol} @ market")
+                click.echo(f"  Setup: {intent.setup}  Stop: {intent.risk_plan.stop:.2f}")
+            else:
+                click.echo(f"\n  Order rejected (risk limit or existing position for {cfg.symbol}).")
+            break  # single position
 
 
 # ---------- vpa status ----------
@@ -270,6 +271,7 @@ def status(ctx: click.Context, fills: int) -> None:
         max_position_pct=cfg.execution.max_position_pct,
         max_cash_per_trade_pct=cfg.execution.max_cash_per_trade_pct,
         initial_cash=cfg.execution.initial_cash,
+        uuid_ids=cfg.execution.uuid_ids,
     )
     pos = executor.get_position(cfg.symbol)
     cash = executor._get_cash()
@@ -309,6 +311,7 @@ def replay(ctx: click.Context, window: int, last_n: int | None, sensitivity: boo
     from config.vpa_config import load_vpa_config
     from data.bar_store import BarStore
     from vpa_core.context_engine import analyze as analyze_context
+    from vpa_core.context_gates import block_key
     from vpa_core.pipeline import run_pipeline
     from vpa_core.risk_engine import AccountState
     from vpa_core.sensitivity import NearMiss, compute_near_misses
@@ -352,8 +355,7 @@ def replay(ctx: click.Context, window: int, last_n: int | None, sensitivity: boo
             signal_counter[sig.id] += 1
         if result.gate_result:
             for sig in result.gate_result.blocked:
-                key = f"{sig.id}@{sig.ts.isoformat()}"
-                reason = result.gate_result.block_reasons.get(key, "unknown")
+                reason = result.gate_result.block_reasons.get(block_key(sig), "unknown")
                 gate_blocks[reason] += 1
         intent_count += len(result.intents)
         bars_evaluated += 1
@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING
 
 from vpa_core.contracts import Bar, ContextWindow, Signal, TradePlan
 from vpa_core.context import detect_context
+from vpa_core.context_gates import block_key
 from vpa_core.features import bar_range, close_location, spread
 from vpa_core.relative_volume import average_volume, relative_volume_for_bar
 
@@ -152,13 +153,13 @@ def format_pipeline_scan(
         if result.gate_result.blocked:
             lines.append(f"  Blocked  ({len(result.gate_result.blocked)}):")
             for sig in result.gate_result.blocked:
-                reason = result.gate_result.block_reasons.get(sig.id, "unknown")
+                reason = result.gate_result.block_reasons.get(block_key(sig), "unknown")
                 lines.append(f"    ✗ {sig.id}: {reason}")
 
     if result.matches:
         lines.append("")
         for m in result.matches:
-            chain = " → ".join(s.id for s in m.signals)
+            chain = " → ".join(m.signal_ids)
             lines.append(f"  SETUP MATCH: {m.setup_id} ({m.direction}) — {chain}")
 
     if result.intents:
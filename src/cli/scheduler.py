@@ -211,30 +211,30 @@ def _run_paper_cycle(
         max_position_pct=cfg.execution.max_position_pct,
         max_cash_per_trade_pct=cfg.execution.max_cash_per_trade_pct,
         initial_cash=cfg.execution.initial_cash,
+        uuid_ids=cfg.execution.uuid_ids,
     )
-    journal = JournalWriter(cfg.journal.path, echo_stdout=cfg.journal.echo_stdout)
-
-    for intent in ready_intents:
-        order = executor.submit_intent(cfg.symbol, intent, bars[-1].close)
-        if order:
-            rationale_str = " -> ".join(intent.rationale)
-            journal.signal(intent.setup, intent.direction, rationale_str, intent.setup)
-            click.echo(f"  Paper order submitted: {order.side} {order.qty} {order.symbol} @ market")
-            click.echo(f"  Setup: {intent.setup}  Stop: {intent.risk_plan.stop:.2f}")
-            if events:
-                events.trade_submitted(
-                    setup=intent.setup,
-                    direction=intent.direction,
-                    qty=order.qty,
-                    stop=intent.risk_plan.stop,
-                )
-        else:
-            click.echo(f"  Order rejected (risk limit or existing position for {cfg.symbol}).")
-            if events:
-                events.order_rejected(
-                    reason=f"Risk limit or existing position for {cfg.symbol}",
-                )
-        break
+    with JournalWriter(cfg.journal.path, echo_stdout=cfg.journal.echo_stdout) as journal:
+        for intent in ready_intents:
+            order = executor.submit_intent(cfg.symbol, intent, bars[-1].close)
+            if order:
+                rationale_str = " -> ".join(intent.rationale)
+                journal.signal(intent.setup, intent.direction, rationale_str, intent.setup)
+                click.echo(f"  Paper order submitted: {order.side} {order.qty} {order.symbol} @ market")
+                click.echo(f"  Setup: {intent.setup}  Stop: {intent.risk_plan.stop:.2f}")
+                if events:
+                    events.trade_submitted(
+                        setup=intent.setup,
+                        direction=intent.direction,
+                        qty=order.qty,
+                        stop=intent.risk_plan.stop,
+                    )
+            else:
+                click.echo(f"  Order rejected (risk limit or existing position for {cfg.symbol}).")
+                if events:
+                    events.order_rejected(
+                        reason=f"Risk limit or existing position for {cfg.symbol}",
+                    )
+            break
 
     if events:
         events.cycle_complete(signals=len(result.signals), intents=len(ready_intents))
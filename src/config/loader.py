@@ -36,6 +36,7 @@ class ExecutionConfig:
     initial_cash: float = 100_000.0
     kill_switch: bool = False
     max_daily_loss_pct: float = 3.0
+    uuid_ids: bool = False
 
 
 @dataclass(frozen=True)
@@ -104,6 +105,7 @@ def load_config(path: str | Path = "config.yaml") -> AppConfig:
         initial_cash=float(ex_raw.get("initial_cash", 100_000)),
         kill_switch=bool(ex_raw.get("kill_switch", False)),
         max_daily_loss_pct=float(ex_raw.get("max_daily_loss_pct", 3.0)),
+        uuid_ids=bool(ex_raw.get("uuid_ids", False)),
     )
 
     j_raw = raw.get("journal", {})
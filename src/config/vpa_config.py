@@ -64,32 +64,32 @@ DEFAULT_SCHEMA_PATH = _PROJECT_ROOT / "docs" / "config" / "vpa_config.schema.jso
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VolThresholds:
     low_lt: float
     high_gt: float
     ultra_high_gt: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VolConfig:
     avg_window_N: int
     thresholds: VolThresholds
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SpreadThresholds:
     narrow_lt: float
     wide_gt: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SpreadConfig:
     avg_window_M: int
     thresholds: SpreadThresholds
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TrendConfig:
     window_K: int
     location_lookback: int = 20
@@ -97,19 +97,19 @@ class TrendConfig:
     congestion_pct: float = 0.30
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SetupConfig:
     window_X: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GatesConfig:
     ctx1_trend_location_required: bool
     ctx2_dominant_alignment_policy: str   # "ALLOW" | "REDUCE_RISK" | "DISALLOW"
     ctx3_congestion_awareness_required: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VPAExecutionConfig:
     """Anti-lookahead execution semantics (distinct from legacy ExecutionConfig)."""
     signal_eval: str        # "BAR_CLOSE_ONLY"
@@ -117,46 +117,46 @@ class VPAExecutionConfig:
     intrabar_allowed: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CostsConfig:
     fee_model: str   # "BPS" | "PER_TRADE"
     fee_value: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SlippageConfig:
     model: str    # "BPS" | "TICKS"
     value: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HammerConfig:
     lower_wick_ratio_min: float
     body_ratio_max: float
     upper_wick_ratio_max: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ShootingStarConfig:
     upper_wick_ratio_min: float
     body_ratio_max: float
     lower_wick_ratio_max: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LongLeggedDojiConfig:
     body_ratio_max: float
     min_wick_ratio: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CandlePatternsConfig:
     hammer: HammerConfig
     shooting_star: ShootingStarConfig
     long_legged_doji: LongLeggedDojiConfig
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RiskConfig:
     risk_pct_per_trade: float
     max_concurrent_positions: int
@@ -164,20 +164,20 @@ class RiskConfig:
     daily_loss_limit_pct: float | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VolumeGuardConfig:
     enabled: bool = True
     min_avg_volume: int = 10_000
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AtrConfig:
     period: int = 14
     stop_multiplier: float = 1.5
     enabled: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VPAConfig:
     """Top-level VPA configuration. All thresholds for the determinism layer."""
     version: str
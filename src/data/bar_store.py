@@ -9,6 +9,41 @@ from typing import Sequence
 
 from vpa_core.contracts import Bar
 
+_FETCH_BATCH = 10_000  # rows per fetchmany() round-trip
+_STATEMENT_CACHE = 256
+
+
+def _build_get_bars_query(has_since: bool, has_until: bool, has_limit: bool) -> str:
+    q = "SELECT ts_utc, open, high, low, close, volume FROM bars WHERE symbol = ? AND timeframe = ?"
+    if has_since:
+        q += " AND ts_utc >= ?"
+    if has_until:
+        q += " AND ts_utc <= ?"
+    q += " ORDER BY ts_utc ASC"
+    if has_limit:
+        q += " LIMIT ?"
+    return q
+
+
+def _build_last_bars_query(has_until: bool) -> str:
+    q = "SELECT ts_utc, open, high, low, close, volume FROM bars WHERE symbol = ? AND timeframe = ?"
+    if has_until:
+        q += " AND ts_utc <= ?"
+    q += " ORDER BY ts_utc DESC LIMIT ?"
+    # Outer query restores ascending order so rows can be streamed.
+    return f"SELECT * FROM ({q}) ORDER BY ts_utc ASC"
+
+
+# Pre-built SQL per query shape, keyed by which optional filters are present,
+# so the text is identical on every call and hits the statement cache.
+_GET_BARS_Q: dict[tuple[bool, bool, bool], str] = {
+    (since, until, limit): _build_get_bars_query(since, until, limit)
+    for since in (False, True)
+    for until in (False, True)
+    for limit in (False, True)
+}
+_LAST_BARS_Q: dict[bool, str] = {u: _build_last_bars_query(u) for u in (False, True)}
+
 
 def _utc_ts(ts: datetime) -> datetime:
     if ts.tzinfo is None:
@@ -25,7 +60,7 @@ class BarStore:
         self._init_schema()
 
     def _conn(self) -> sqlite3.Connection:
-        return sqlite3.connect(str(self._path))
+        return sqlite3.connect(str(self._path), cached_statements=_STATEMENT_CACHE)
 
     def _init_schema(self) -> None:
         with self._conn() as c:
@@ -73,21 +108,16 @@ class BarStore:
         limit: int | None = None,
     ) -> list[Bar]:
         """Return bars in ascending time order. All timestamps in UTC."""
+        params: list = [symbol, timeframe]
+        if since is not None:
+            params.append(_utc_ts(since).isoformat())
+        if until is not None:
+            params.append(_utc_ts(until).isoformat())
+        if limit is not None:
+            params.append(limit)
+        q = _GET_BARS_Q[(since is not None, until is not None, limit is not None)]
         with self._conn() as c:
-            q = "SELECT ts_utc, open, high, low, close, volume FROM bars WHERE symbol = ? AND timeframe = ?"
-            params: list = [symbol, timeframe]
-            if since is not None:
-                q += " AND ts_utc >= ?"
-                params.append(_utc_ts(since).isoformat())
-            if until is not None:
-                q += " AND ts_utc <= ?"
-                params.append(_utc_ts(until).isoformat())
-            q += " ORDER BY ts_utc ASC"
-            if limit is not None:
-                q += " LIMIT ?"
-                params.append(limit)
-            rows = c.execute(q, params).fetchall()
-        return self._rows_to_bars(rows, symbol)
+            return self._rows_to_bars(c.execute(q, params), symbol)
 
     def count_bars(self, symbol: str, timeframe: str) -> int:
         """Return the total number of bars stored for a symbol/timeframe pair."""
@@ -107,38 +137,32 @@ class BarStore:
         until: datetime | None = None,
     ) -> list[Bar]:
         """Return the last n bars (by time) in ascending order. For context window."""
+        params: list = [symbol, timeframe]
+        if until is not None:
+            params.append(_utc_ts(until).isoformat())
+        params.append(n)
         with self._conn() as c:
-            q = (
-                "SELECT ts_utc, open, high, low, close, volume FROM bars "
-                "WHERE symbol = ? AND timeframe = ?"
-            )
-            params: list = [symbol, timeframe]
-            if until is not None:
-                q += " AND ts_utc <= ?"
-                params.append(_utc_ts(until).isoformat())
-            q += " ORDER BY ts_utc DESC LIMIT ?"
-            params.append(n)
-            rows = c.execute(q, params).fetchall()
-        rows = list(reversed(rows))  # back to ascending
-        return self._rows_to_bars(rows, symbol)
-
-    def _rows_to_bars(self, rows: list, symbol: str) -> list[Bar]:
+            return self._rows_to_bars(c.execute(_LAST_BARS_Q[until is not None], params), symbol)
+
+    def _rows_to_bars(self, cur: sqlite3.Cursor, symbol: str) -> list[Bar]:
+        """Convert cursor rows to Bars, fetching in large batches.
+
+        SQLite has no native datetime; we store ISO strings written by
+        ``_utc_ts(...).isoformat()``, so they always carry a ``+00:00`` offset
+        and never a ``Z`` suffix. Hot names are bound as locals for the loop.
+        """
         out: list[Bar] = []
-        for i, (ts_utc, o, h, l, c, vol) in enumerate(rows):
-            # SQLite has no native datetime; we store ISO strings
-            ts = datetime.fromisoformat(ts_utc.replace("Z", "+00:00"))
-            if ts.tzinfo is None:
-                ts = ts.replace(tzinfo=timezone.utc)
-            out.append(
-                Bar(
-                    open=o,
-                    high=h,
-                    low=l,
-                    close=c,
-                    volume=vol,
-                    timestamp=ts,
-                    symbol=symbol,
-                    bar_index=i,
-                )
-            )
+        append = out.append
+        _fromiso = datetime.fromisoformat
+        _Bar = Bar
+        _utc = timezone.utc
+        i = 0
+        cur.arraysize = _FETCH_BATCH
+        while batch := cur.fetchmany():
+            for ts_utc, o, h, l, c, vol in batch:
+                ts = _fromiso(ts_utc)
+                if ts.tzinfo is None:
+                    ts = ts.replace(tzinfo=_utc)
+                append(_Bar(o, h, l, c, vol, ts, symbol, i))
+                i += 1
         return out
@@ -2,8 +2,7 @@
 Provide rolling context window (last N bars) for vpa-core.
 """
 
-from datetime import datetime, timezone
-
+from vpa_core._timeutil import parse_iso_utc
 from vpa_core.contracts import ContextWindow
 
 from data.bar_store import BarStore
@@ -22,11 +21,7 @@ def get_context_window(
     If `end_time` is given (ISO UTC), load bars up to that time; else use latest.
     Returns None if no bars.
     """
-    from datetime import datetime, timezone
-
-    until = datetime.fromisoformat(end_time.replace("Z", "+00:00")) if end_time else None
-    if until is not None and until.tzinfo is None:
-        until = until.replace(tzinfo=timezone.utc)
+    until = parse_iso_utc(end_time) if end_time else None
     bars = store.get_last_bars(symbol, timeframe, window_size, until=until)
     if not bars:
         return None
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Order:
     symbol: str
     side: str  # "buy" | "sell"
@@ -16,7 +16,7 @@ class Order:
     limit_price: float | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Fill:
     id: str
     order_id: str
@@ -28,7 +28,7 @@ class Fill:
     slippage_bps: float | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Position:
     symbol: str
     side: str  # "long" | "short"
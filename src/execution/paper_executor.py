@@ -2,15 +2,62 @@
 Paper executor: single-writer order/position state, risk limits, restart-safe (SQLite).
 """
 
+import itertools
+import math
+import os
 import sqlite3
+import threading
 import uuid
-from datetime import datetime, timezone
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Iterator
 
+from vpa_core._timeutil import parse_iso_utc
 from vpa_core.contracts import TradeIntent, TradeIntentStatus, TradePlan
 
 from execution.models import Fill, Order, Position
 
+# Per-connection tuning. synchronous=NORMAL is durable across crashes in WAL
+# mode (only the last commit may roll back on power loss).
+_CONN_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=10000",
+    "PRAGMA cache_size=-20000",  # ~20 MB page cache
+)
+_STATEMENT_CACHE = 256
+
+# Hot-path SQL. Keeping each statement as one module-level string means the
+# text is identical on every call, so sqlite3's per-connection statement cache
+# reuses the prepared statement instead of re-parsing it.
+_SQL_SELECT_CASH = "SELECT balance FROM cash WHERE id = 1"
+_SQL_SET_CASH = "UPDATE cash SET balance = ? WHERE id = 1"
+_SQL_DEBIT_CASH = "UPDATE cash SET balance = balance - ? WHERE id = 1"
+_SQL_SELECT_POS_QTY = "SELECT qty FROM positions WHERE symbol = ?"
+_SQL_SELECT_POS = "SELECT symbol, side, qty, avg_price, updated_at FROM positions WHERE symbol = ?"
+_SQL_INSERT_ORDER = (
+    "INSERT INTO orders (id, symbol, side, qty, order_type, ts_utc, trade_plan_ref, limit_price) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_SQL_INSERT_FILL = (
+    "INSERT INTO fills (id, order_id, symbol, side, qty, price, ts_utc, slippage_bps) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_SQL_UPSERT_POSITION = (
+    "INSERT OR REPLACE INTO positions (symbol, side, qty, avg_price, updated_at) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+_SQL_SELECT_FILLS = (
+    "SELECT id, order_id, symbol, side, qty, price, ts_utc, slippage_bps FROM fills "
+    "ORDER BY ts_utc DESC LIMIT ?"
+)
+_SQL_SELECT_FILLS_BY_SYMBOL = (
+    "SELECT id, order_id, symbol, side, qty, price, ts_utc, slippage_bps FROM fills "
+    "WHERE symbol = ? ORDER BY ts_utc DESC LIMIT ?"
+)
+
 
 def _utc(ts: datetime) -> datetime:
     if ts.tzinfo is None:
@@ -18,10 +65,144 @@ def _utc(ts: datetime) -> datetime:
     return ts.astimezone(timezone.utc)
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_US = timedelta(microseconds=1)
+
+
+def _to_us(ts: datetime) -> int:
+    """UTC datetime -> integer microseconds since the Unix epoch (exact)."""
+    return (_utc(ts) - _EPOCH) // _ONE_US
+
+
+def _from_us(us: int) -> datetime:
+    """Integer microseconds since the Unix epoch -> aware UTC datetime (exact)."""
+    return _EPOCH + timedelta(microseconds=us)
+
+
+# Paper ids: process prefix (start time in µs + pid) plus a shared counter.
+# Unique across restarts and executors without a urandom read per id.
+_ID_PREFIX = f"{_to_us(datetime.now(timezone.utc)):x}-{os.getpid():x}-"
+_ID_SEQ = itertools.count()
+
+
+def _fast_id() -> str:
+    return f"{_ID_PREFIX}{next(_ID_SEQ):x}"
+
+
+def _uuid4_str() -> str:
+    return str(uuid.uuid4())
+
+
+# Timestamps are stored as INTEGER microseconds since the epoch (UTC): a fixed
+# 8-byte key keeps the fills indexes small and reading one back is arithmetic,
+# not an ISO parse.
+_TABLES: dict[str, str] = {
+    "orders": """
+        CREATE TABLE IF NOT EXISTS orders (
+            id TEXT PRIMARY KEY,
+            symbol TEXT NOT NULL,
+            side TEXT NOT NULL,
+            qty REAL NOT NULL,
+            order_type TEXT NOT NULL,
+            ts_utc INTEGER NOT NULL,
+            trade_plan_ref TEXT,
+            limit_price REAL
+        )
+    """,
+    "fills": """
+        CREATE TABLE IF NOT EXISTS fills (
+            id TEXT PRIMARY KEY,
+            order_id TEXT NOT NULL,
+            symbol TEXT NOT NULL,
+            side TEXT NOT NULL,
+            qty REAL NOT NULL,
+            price REAL NOT NULL,
+            ts_utc INTEGER NOT NULL,
+            slippage_bps REAL
+        )
+    """,
+    "positions": """
+        CREATE TABLE IF NOT EXISTS positions (
+            symbol TEXT PRIMARY KEY,
+            side TEXT NOT NULL,
+            qty REAL NOT NULL,
+            avg_price REAL NOT NULL,
+            updated_at INTEGER NOT NULL
+        )
+    """,
+    "cash": """
+        CREATE TABLE IF NOT EXISTS cash (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            balance REAL NOT NULL
+        )
+    """,
+}
+_TS_COLUMNS = {"orders": "ts_utc", "fills": "ts_utc", "positions": "updated_at"}
+
+
+def _migrate_iso_timestamps(c: sqlite3.Connection) -> None:
+    """Rebuild tables created by older versions with ISO TEXT timestamps.
+
+    A TEXT-affinity column would coerce integers back to text, so the table
+    is recreated with the INTEGER schema and its rows copied across.
+    Runs inside the caller's transaction; a no-op on current schemas.
+    """
+    for table, ts_col in _TS_COLUMNS.items():
+        info = c.execute(f"PRAGMA table_info({table})").fetchall()
+        cols = [row[1] for row in info]
+        decl = {row[1]: row[2].upper() for row in info}
+        if decl.get(ts_col) != "TEXT":
+            continue
+        legacy = f"{table}_legacy"
+        c.execute(f"ALTER TABLE {table} RENAME TO {legacy}")
+        c.execute(_TABLES[table])
+        ts_idx = cols.index(ts_col)
+        rows = []
+        for row in c.execute(f"SELECT {', '.join(cols)} FROM {legacy}"):
+            row = list(row)
+            row[ts_idx] = _to_us(parse_iso_utc(row[ts_idx]))
+            rows.append(row)
+        c.executemany(
+            f"INSERT INTO {table} ({', '.join(cols)}) VALUES ({', '.join('?' * len(cols))})",
+            rows,
+        )
+        c.execute(f"DROP TABLE {legacy}")
+
+
+def _record_market_fill(
+    c: sqlite3.Connection,
+    *,
+    order_id: str,
+    fill_id: str,
+    symbol: str,
+    side: str,
+    qty: int,
+    ts: int,
+    trade_plan_ref: str | None,
+    position_side: str,
+    is_long: bool,
+    price: float,
+    slippage_bps: float,
+) -> None:
+    """Write an immediately-filled market order: order, fill, position, cash.
+
+    Runs on the caller's open transaction. SQLite cannot insert into
+    several tables from one statement (no DML in CTEs), so this is four
+    prepared statements committed together rather than one.
+    """
+    c.execute(_SQL_INSERT_ORDER, (order_id, symbol, side, qty, "market", ts, trade_plan_ref, None))
+    c.execute(_SQL_INSERT_FILL, (fill_id, order_id, symbol, side, qty, price, ts, slippage_bps))
+    c.execute(_SQL_UPSERT_POSITION, (symbol, position_side, qty if is_long else -qty, price, ts))
+    if is_long:
+        c.execute(_SQL_DEBIT_CASH, (price * qty,))
+
+
 class PaperExecutor:
     """
     Convert TradePlans to orders; track orders and positions in SQLite.
     Single writer (one process). Risk limits enforced before placing order.
+
+    Holds one SQLite connection for its lifetime; call close() when done.
     """
 
     def __init__(
@@ -31,76 +212,79 @@ class PaperExecutor:
         max_position_pct: float = 10.0,
         max_cash_per_trade_pct: float = 5.0,
         initial_cash: float = 100_000.0,
+        uuid_ids: bool = False,
     ) -> None:
         self._path = Path(state_path)
+        self._in_memory = str(state_path) == ":memory:"
         self._path.parent.mkdir(parents=True, exist_ok=True)
         self._max_position_pct = max_position_pct
         self._max_cash_per_trade_pct = max_cash_per_trade_pct
+        self._risk_frac = max_cash_per_trade_pct / 100
+        self._new_id = _uuid4_str if uuid_ids else _fast_id
         self._initial_cash = initial_cash
+        self._lock = threading.RLock()
+        # Autocommit mode: transactions are opened explicitly by _write().
+        self._cx = sqlite3.connect(
+            str(self._path),
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=_STATEMENT_CACHE,
+        )
+        for pragma in _CONN_PRAGMAS:
+            self._cx.execute(pragma)
+        # WAL is persistent in the file header: set once, it sticks. Writers
+        # then fsync once per commit and readers (dashboard, `vpa status`)
+        # never block the writer. Not applicable to in-memory databases.
+        if not self._in_memory:
+            self._cx.execute("PRAGMA journal_mode=WAL")
         self._init_schema()
 
-    def _conn(self) -> sqlite3.Connection:
-        return sqlite3.connect(str(self._path), timeout=10.0)
+    @contextmanager
+    def _conn(self) -> Iterator[sqlite3.Connection]:
+        """Serialize use of the shared connection for reads (autocommit)."""
+        with self._lock:
+            yield self._cx
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        """One BEGIN IMMEDIATE ... COMMIT transaction; rolled back on error."""
+        with self._lock:
+            cx = self._cx
+            cx.execute("BEGIN IMMEDIATE")
+            try:
+                yield cx
+            except BaseException:
+                cx.execute("ROLLBACK")
+                raise
+            cx.execute("COMMIT")
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._cx.close()
 
     def _init_schema(self) -> None:
-        with self._conn() as c:
-            c.execute(
-                """
-                CREATE TABLE IF NOT EXISTS orders (
-                    id TEXT PRIMARY KEY,
-                    symbol TEXT NOT NULL,
-                    side TEXT NOT NULL,
-                    qty REAL NOT NULL,
-                    order_type TEXT NOT NULL,
-                    ts_utc TEXT NOT NULL,
-                    trade_plan_ref TEXT,
-                    limit_price REAL
-                )
-                """
-            )
-            c.execute(
-                """
-                CREATE TABLE IF NOT EXISTS fills (
-                    id TEXT PRIMARY KEY,
-                    order_id TEXT NOT NULL,
-                    symbol TEXT NOT NULL,
-                    side TEXT NOT NULL,
-                    qty REAL NOT NULL,
-                    price REAL NOT NULL,
-                    ts_utc TEXT NOT NULL,
-                    slippage_bps REAL
-                )
-                """
-            )
-            c.execute(
-                """
-                CREATE TABLE IF NOT EXISTS positions (
-                    symbol TEXT PRIMARY KEY,
-                    side TEXT NOT NULL,
-                    qty REAL NOT NULL,
-                    avg_price REAL NOT NULL,
-                    updated_at TEXT NOT NULL
-                )
-                """
-            )
-            c.execute(
-                """
-                CREATE TABLE IF NOT EXISTS cash (
-                    id INTEGER PRIMARY KEY CHECK (id = 1),
-                    balance REAL NOT NULL
-                )
-                """
-            )
+        with self._write() as c:
+            for ddl in _TABLES.values():
+                c.execute(ddl)
+            _migrate_iso_timestamps(c)
+            # list_fills reads newest-first, optionally per symbol: index both
+            # shapes so it walks the index instead of scanning and sorting.
+            c.execute("CREATE INDEX IF NOT EXISTS idx_fills_symbol_ts ON fills (symbol, ts_utc DESC)")
+            c.execute("CREATE INDEX IF NOT EXISTS idx_fills_ts ON fills (ts_utc DESC)")
             c.execute("INSERT OR IGNORE INTO cash (id, balance) VALUES (1, ?)", (self._initial_cash,))
 
+    def _read_cash(self, c: sqlite3.Connection) -> float:
+        row = c.execute(_SQL_SELECT_CASH).fetchone()
+        return float(row[0]) if row else self._initial_cash
+
     def _get_cash(self) -> float:
         with self._conn() as c:
-            row = c.execute("SELECT balance FROM cash WHERE id = 1").fetchone()
-            return float(row[0]) if row else self._initial_cash
+            return self._read_cash(c)
 
     def _set_cash(self, balance: float) -> None:
-        with self._conn() as c:
-            c.execute("UPDATE cash SET balance = ? WHERE id = 1", (balance,))
+        with self._write() as c:
+            c.execute(_SQL_SET_CASH, (balance,))
 
     def submit(self, symbol: str, plan: TradePlan, current_price: float, *, slippage_bps: float = 5.0) -> Order | None:
         """DEPRECATED: use submit_intent(). Convert TradePlan to order if risk limits allow."""
@@ -128,42 +312,36 @@ class PaperExecutor:
         if qty <= 0:
             return None
 
-        with self._conn() as c:
-            pos_row = c.execute(
-                "SELECT qty FROM positions WHERE symbol = ?", (symbol,)
-            ).fetchone()
+        # Position check, cash read and all writes share one transaction.
+        with self._write() as c:
+            pos_row = c.execute(_SQL_SELECT_POS_QTY, (symbol,)).fetchone()
             if pos_row and pos_row[0] != 0:
                 return None
 
-            cash = self._get_cash()
-            cost = fill_price * qty
-            if is_long and cost > cash:
-                qty = int(cash / fill_price)
+            cash = self._read_cash(c)
+            if is_long and fill_price * qty > cash:
+                qty = math.floor(cash / fill_price)
             if qty <= 0:
                 return None
 
-            order_id = str(uuid.uuid4())
-            ts = _utc(datetime.now(timezone.utc)).isoformat()
-            c.execute(
-                """INSERT INTO orders (id, symbol, side, qty, order_type, ts_utc, trade_plan_ref, limit_price)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                (order_id, symbol, side, qty, "market", ts, intent.setup, None),
+            order_id = self._new_id()
+            now = datetime.now(timezone.utc)
+            slip = slippage_bps / 10_000
+            adj = 1 + slip if is_long else 1 - slip
+            _record_market_fill(
+                c,
+                order_id=order_id,
+                fill_id=self._new_id(),
+                symbol=symbol,
+                side=side,
+                qty=qty,
+                ts=_to_us(now),
+                trade_plan_ref=intent.setup,
+                position_side=intent.direction,
+                is_long=is_long,
+                price=fill_price * adj,
+                slippage_bps=slippage_bps,
             )
-            adj = 1 + slippage_bps / 10_000 if is_long else 1 - slippage_bps / 10_000
-            actual_price = fill_price * adj
-            fill_id = str(uuid.uuid4())
-            c.execute(
-                """INSERT INTO fills (id, order_id, symbol, side, qty, price, ts_utc, slippage_bps)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                (fill_id, order_id, symbol, side, qty, actual_price, ts, slippage_bps),
-            )
-            c.execute(
-                """INSERT OR REPLACE INTO positions (symbol, side, qty, avg_price, updated_at)
-                   VALUES (?, ?, ?, ?, ?)""",
-                (symbol, intent.direction, qty if is_long else -qty, actual_price, ts),
-            )
-            if is_long:
-                c.execute("UPDATE cash SET balance = balance - ?", (actual_price * qty,))
 
         return Order(
             id=order_id,
@@ -171,7 +349,7 @@ class PaperExecutor:
             side=side,
             qty=qty,
             order_type="market",
-            timestamp=datetime.fromisoformat(ts.replace("Z", "+00:00")),
+            timestamp=now,
             trade_plan_ref=intent.setup,
             limit_price=None,
         )
@@ -183,85 +361,67 @@ class PaperExecutor:
         current_price: float,
         slippage_bps: float,
     ) -> Order | None:
-        with self._conn() as c:
-            pos_row = c.execute("SELECT qty FROM positions WHERE symbol = ?", (symbol,)).fetchone()
+        with self._write() as c:
+            pos_row = c.execute(_SQL_SELECT_POS_QTY, (symbol,)).fetchone()
             if pos_row and pos_row[0] != 0:
                 return None  # Already have position
-            cash = self._get_cash()
+            cash = self._read_cash(c)
             stop_level = plan.stop_level
             stop_price = float(stop_level) if isinstance(stop_level, (int, float)) else current_price * 0.99
             risk_per_share = abs(current_price - stop_price)
             if risk_per_share <= 0:
                 return None
-            risk_amount = cash * (self._max_cash_per_trade_pct / 100)
-            qty = int(risk_amount / risk_per_share)
+            qty = math.floor(cash * self._risk_frac / risk_per_share)
             if qty <= 0:
                 return None
-            cost = current_price * qty
-            if plan.direction == "long" and cost > cash:
-                qty = int(cash / current_price)
+            is_long = plan.direction == "long"
+            if is_long and current_price * qty > cash:
+                qty = math.floor(cash / current_price)
             if qty <= 0:
                 return None
-            order_id = str(uuid.uuid4())
-            ts = _utc(datetime.now(timezone.utc)).isoformat()
-            c.execute(
-                """INSERT INTO orders (id, symbol, side, qty, order_type, ts_utc, trade_plan_ref, limit_price)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    order_id,
-                    symbol,
-                    "buy" if plan.direction == "long" else "sell",
-                    qty,
-                    "market",
-                    ts,
-                    plan.signal_id,
-                    None,
-                ),
-            )
+            order_id = self._new_id()
+            now = datetime.now(timezone.utc)
             # Paper: fill immediately at current_price with slippage
-            fill_id = str(uuid.uuid4())
-            fill_price = current_price * (1 + slippage_bps / 10_000) if plan.direction == "long" else current_price * (1 - slippage_bps / 10_000)
-            c.execute(
-                """INSERT INTO fills (id, order_id, symbol, side, qty, price, ts_utc, slippage_bps) VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                (fill_id, order_id, symbol, "buy" if plan.direction == "long" else "sell", qty, fill_price, ts, slippage_bps),
-            )
-            c.execute(
-                """INSERT OR REPLACE INTO positions (symbol, side, qty, avg_price, updated_at) VALUES (?, ?, ?, ?, ?)""",
-                (symbol, plan.direction, qty if plan.direction == "long" else -qty, fill_price, ts),
+            slip = slippage_bps / 10_000
+            fill_price = current_price * (1 + slip if is_long else 1 - slip)
+            _record_market_fill(
+                c,
+                order_id=order_id,
+                fill_id=self._new_id(),
+                symbol=symbol,
+                side="buy" if is_long else "sell",
+                qty=qty,
+                ts=_to_us(now),
+                trade_plan_ref=plan.signal_id,
+                position_side=plan.direction,
+                is_long=is_long,
+                price=fill_price,
+                slippage_bps=slippage_bps,
             )
-            if plan.direction == "long":
-                c.execute("UPDATE cash SET balance = balance - ?", (fill_price * qty,))
         return Order(
             id=order_id,
             symbol=symbol,
-            side="buy" if plan.direction == "long" else "sell",
+            side="buy" if is_long else "sell",
             qty=qty,
             order_type="market",
-            timestamp=datetime.fromisoformat(ts.replace("Z", "+00:00")),
+            timestamp=now,
             trade_plan_ref=plan.signal_id,
             limit_price=None,
         )
 
     def get_position(self, symbol: str) -> Position | None:
         with self._conn() as c:
-            row = c.execute("SELECT symbol, side, qty, avg_price, updated_at FROM positions WHERE symbol = ?", (symbol,)).fetchone()
+            row = c.execute(_SQL_SELECT_POS, (symbol,)).fetchone()
             if not row or row[2] == 0:
                 return None
-            ts = datetime.fromisoformat(row[4].replace("Z", "+00:00"))
-            return Position(symbol=row[0], side=row[1], qty=row[2], avg_price=row[3], updated_at=ts)
+            return Position(symbol=row[0], side=row[1], qty=row[2], avg_price=row[3], updated_at=_from_us(row[4]))
 
     def list_fills(self, symbol: str | None = None, limit: int = 100) -> list[Fill]:
         with self._conn() as c:
             if symbol:
-                rows = c.execute(
-                    "SELECT id, order_id, symbol, side, qty, price, ts_utc, slippage_bps FROM fills WHERE symbol = ? ORDER BY ts_utc DESC LIMIT ?",
-                    (symbol, limit),
-                ).fetchall()
+                rows = c.execute(_SQL_SELECT_FILLS_BY_SYMBOL, (symbol, limit)).fetchall()
             else:
-                rows = c.execute(
-                    "SELECT id, order_id, symbol, side, qty, price, ts_utc, slippage_bps FROM fills ORDER BY ts_utc DESC LIMIT ?",
-                    (limit,),
-                ).fetchall()
+                rows = c.execute(_SQL_SELECT_FILLS, (limit,)).fetchall()
         return [
             Fill(
                 id=r[0],
@@ -270,7 +430,7 @@ class PaperExecutor:
                 side=r[3],
                 qty=r[4],
                 price=r[5],
-                timestamp=datetime.fromisoformat(r[6].replace("Z", "+00:00")),
+                timestamp=_from_us(r[6]),
                 slippage_bps=r[7],
             )
             for r in rows
@@ -2,39 +2,163 @@
 Structured journal: append-only JSON lines. Every event has rationale and rulebook_ref when applicable.
 """
 
+import dataclasses
 import json
+import os
+import queue
+import threading
+import weakref
 from datetime import datetime, timezone
+from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
+try:  # optional fast encoder: pip install -e ".[perf]"
+    import orjson
 
-def _serialize(obj: Any) -> Any:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """Encode the types JSON has no native form for; the encoder recurses into the result."""
     if isinstance(obj, datetime):
         return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj) if not f.name.startswith("_")}
     if hasattr(obj, "__dict__") and not isinstance(obj, type):
-        return {k: _serialize(v) for k, v in vars(obj).items() if not k.startswith("_")}
-    if isinstance(obj, dict):
-        return {k: _serialize(v) for k, v in obj.items()}
-    if isinstance(obj, (list, tuple)):
-        return [_serialize(x) for x in obj]
-    return obj
+        return {k: v for k, v in vars(obj).items() if not k.startswith("_")}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(record: dict) -> bytes:
+    """Encode one record; orjson when installed, else the stdlib encoder.
+
+    Dataclasses and datetimes are passed through to _default so both encoders
+    produce the same records. Two differences remain: orjson emits compact
+    separators, and it writes NaN/Infinity as null where json writes the
+    non-standard NaN/Infinity literals.
+    """
+    if orjson is not None:
+        return orjson.dumps(record, default=_default, option=_ORJSON_OPTIONS)
+    return json.dumps(record, default=_default).encode()
+
+
+_SYNC = object()
+_STOP = object()
+
+
+def _sync_loop(q: queue.SimpleQueue, f: BinaryIO, dirty: threading.Event, errors: list[BaseException]) -> None:
+    """Writer-thread body: one fsync per burst of appends, then wake any flush() waiters."""
+    while True:
+        items = [q.get()]
+        while True:
+            try:
+                items.append(q.get_nowait())
+            except queue.Empty:
+                break
+        dirty.clear()
+        try:
+            os.fsync(f.fileno())
+        except OSError as exc:  # surfaced on the next flush()/close()
+            errors.append(exc)
+        for item in items:
+            if isinstance(item, threading.Event):
+                item.set()
+        if _STOP in items:
+            return
+
+
+def _stop(q: queue.SimpleQueue, thread: threading.Thread, f: BinaryIO) -> None:
+    q.put(_STOP)
+    if thread is not threading.current_thread():  # the collector may run on the writer thread itself
+        thread.join()
+    f.close()
+
+
+_live: set[weakref.finalize] = set()
+
+
+def _stop_live_writers() -> None:
+    for fin in list(_live):
+        fin()
+
+
+# Plain atexit hooks only run after non-daemon threads are joined, which would
+# wait forever on an unclosed writer; this hook runs before that join.
+threading._register_atexit(_stop_live_writers)
 
 
 class JournalWriter:
-    """Append-only journal. Each line is a JSON object with event type and payload."""
+    """Append-only journal. Each line is a JSON object with event type and payload.
+
+    Event methods serialize and append the line on the caller's thread, so it
+    is visible to readers as soon as the call returns. fsync runs on a
+    background thread, once per burst of appends, so callers never wait on
+    the disk. flush() blocks until everything written so far is fsynced;
+    close() does the same and stops the thread. fsync errors resurface from
+    flush()/close(). Writers left open are closed when collected or at exit.
+    """
 
     def __init__(self, path: str | Path, *, echo_stdout: bool = False) -> None:
         self._path = Path(path)
         self._path.parent.mkdir(parents=True, exist_ok=True)
         self._echo = echo_stdout
+        self._f = open(self._path, "ab")
+        self._q: queue.SimpleQueue = queue.SimpleQueue()
+        self._dirty = threading.Event()
+        self._errors: list[BaseException] = []
+        self._closed = False
+        thread = threading.Thread(target=_sync_loop, args=(self._q, self._f, self._dirty, self._errors), name="journal-writer")
+        thread.start()
+        self._finalizer = weakref.finalize(self, _stop, self._q, thread, self._f)
+        self._finalizer.atexit = False
+        _live.add(self._finalizer)
+
+    def __enter__(self) -> "JournalWriter":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def flush(self) -> None:
+        """Block until every line written so far is fsynced."""
+        if self._closed:
+            return
+        done = threading.Event()
+        self._q.put(done)
+        done.wait()
+        self._raise_pending()
+
+    def close(self) -> None:
+        """fsync and close the journal file and stop the thread. Safe to call more than once."""
+        if self._closed:
+            return
+        self._closed = True
+        _live.discard(self._finalizer)
+        self._finalizer()
+        self._raise_pending()
+
+    def _raise_pending(self) -> None:
+        if self._errors:
+            err = self._errors[0]
+            self._errors.clear()
+            raise err
 
     def _write(self, event_type: str, payload: dict) -> None:
-        record = {"ts_utc": datetime.now(timezone.utc).isoformat(), "event": event_type, **payload}
-        line = json.dumps(_serialize(record)) + "\n"
-        with open(self._path, "a") as f:
-            f.write(line)
+        if self._closed:
+            raise ValueError("journal is closed")
+        line = _dumps({"ts_utc": datetime.now(timezone.utc).isoformat(), "event": event_type, **payload})
+        self._f.write(line + b"\n")
+        self._f.flush()
         if self._echo:
-            print(line.rstrip())
+            print(line.decode())
+        if not self._dirty.is_set():
+            self._dirty.set()
+            self._q.put(_SYNC)
 
     def signal(self, setup_type: str, direction: str, rationale: str, rulebook_ref: str, **extra: Any) -> None:
         self._write(
@@ -0,0 +1,24 @@
+"""
+Timestamp helpers shared by the data and execution layers.
+
+Pure functions; no I/O.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+_fromiso = datetime.fromisoformat
+_UTC = timezone.utc
+
+
+def parse_iso_utc(s: str) -> datetime:
+    """Parse an ISO-8601 timestamp; naive input is taken to be UTC.
+
+    A trailing ``Z`` is rewritten only when present, so the common
+    ``+00:00`` form is parsed without allocating a new string.
+    """
+    ts = _fromiso(s[:-1] + "+00:00") if s.endswith("Z") else _fromiso(s)
+    if ts.tzinfo is None:
+        return ts.replace(tzinfo=_UTC)
+    return ts
@@ -17,6 +17,9 @@ Pure function; no I/O.
 
 from __future__ import annotations
 
+from collections import deque
+
+from vpa_core.barframe import BarFrame
 from vpa_core.contracts import Bar
 
 
@@ -49,15 +52,103 @@ def compute_atr(bars: list[Bar], period: int = 14) -> float:
     float
         The ATR value. Returns 0.0 if fewer than 2 bars are provided.
     """
-    if len(bars) < 2:
+    n = len(bars)
+    if n < 2:
         return 0.0
 
-    tr_values: list[float] = []
-    for i in range(1, len(bars)):
-        tr_values.append(true_range(bars[i], bars[i - 1].close))
-
-    if not tr_values:
-        return 0.0
+    # Only the last ``period`` true ranges contribute, so walk just that tail
+    # (plus one bar for the previous close) with True Range inlined. The
+    # window is averaged with sum(), which is compensated on 3.12+, so keep
+    # it rather than a running ``+=`` total.
+    count = min(period, n - 1) if period > 0 else n - 1
+    start = n - count
+    prev_close = bars[start - 1].close
+    trs: list[float] = []
+    append = trs.append
+    for i in range(start, n):
+        b = bars[i]
+        high = b.high
+        low = b.low
+        hl = high - low
+        hc = abs(high - prev_close)
+        lc = abs(low - prev_close)
+        append(hl if hl >= hc and hl >= lc else (hc if hc >= lc else lc))
+        prev_close = b.close
+    return sum(trs) / count
+
+
+class ATRState:
+    """Incremental ``compute_atr`` for a bar stream.
+
+    Feed each bar to ``update`` in order; the returned value equals
+    ``compute_atr`` over every bar seen so far. Only the last ``period``
+    True Ranges are kept (all of them for a non-positive period), so each
+    bar's True Range is computed once instead of on every later call. The
+    window is re-summed with ``sum()`` on each update, as ``compute_atr``
+    does, rather than kept as a running total that would round differently.
+    """
 
-    window = tr_values[-period:] if len(tr_values) >= period else tr_values
-    return sum(window) / len(window)
+    __slots__ = ("_trs", "_prev_close")
+
+    def __init__(self, period: int = 14) -> None:
+        self._trs: deque[float] = deque(maxlen=period if period > 0 else None)
+        self._prev_close: float | None = None
+
+    @property
+    def value(self) -> float:
+        """Current ATR; 0.0 until two bars have been seen."""
+        trs = self._trs
+        if not trs:
+            return 0.0
+        return sum(trs) / len(trs)
+
+    def update(self, bar: Bar) -> float:
+        """Add *bar* and return the updated ATR."""
+        prev_close = self._prev_close
+        self._prev_close = bar.close
+        if prev_close is None:
+            return 0.0
+        high = bar.high
+        low = bar.low
+        hl = high - low
+        hc = abs(high - prev_close)
+        lc = abs(low - prev_close)
+        self._trs.append(hl if hl >= hc and hl >= lc else (hc if hc >= lc else lc))
+        return self.value
+
+
+def true_ranges(bf: BarFrame) -> list[float]:
+    """True Range per bar from BarFrame columns.
+
+    Bar 0 has no previous close, so its entry is plain ``high - low``
+    (``compute_atr`` never reads it).
+    """
+    highs, lows, closes = bf.high, bf.low, bf.close
+    if not closes:
+        return []
+    out = [highs[0] - lows[0]]
+    prev_close = closes[0]
+    for high, low, close in zip(highs[1:], lows[1:], closes[1:]):
+        hl = high - low
+        hc = abs(high - prev_close)
+        lc = abs(low - prev_close)
+        out.append(hl if hl >= hc and hl >= lc else (hc if hc >= lc else lc))
+        prev_close = close
+    return out
+
+
+def compute_atr_batch(bars: list[Bar] | BarFrame, period: int = 14) -> list[float]:
+    """``compute_atr`` for every prefix of *bars* in one pass.
+
+    Element ``i`` equals ``compute_atr(bars[: i + 1], period)``. True
+    Range is computed once per bar as a column, and each window is
+    averaged with ``sum()`` like ``compute_atr``, so results match bit for
+    bit.
+    """
+    bf = bars if isinstance(bars, BarFrame) else BarFrame.from_bars(bars)
+    trs = true_ranges(bf)
+    out = [0.0] * len(trs)
+    for i in range(1, len(trs)):
+        count = min(period, i) if period > 0 else i
+        out[i] = sum(trs[i + 1 - count : i + 1]) / count
+    return out
@@ -0,0 +1,132 @@
+"""
+Column-oriented bar history (struct-of-arrays view of list[Bar]).
+
+Batch feature code walks one field at a time across many bars. Holding
+each OHLCV field in its own flat list means those loops index plain
+lists instead of loading attributes off thousands of Bar objects.
+
+Pure data; no I/O. ``Bar`` remains the per-bar contract — ``bar(i)``
+rebuilds one when legacy code needs it.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from vpa_core.contracts import Bar
+
+
+@dataclass(frozen=True, slots=True)
+class BarFrame:
+    """OHLCV columns for an ordered bar history (oldest first).
+
+    All columns have the same length. ``symbol`` and ``bar_index`` are
+    carried so ``bar(i)`` round-trips the original Bar exactly.
+    """
+
+    open: list[float]
+    high: list[float]
+    low: list[float]
+    close: list[float]
+    volume: list[int]
+    timestamp: list[datetime]
+    symbol: list[str]
+    bar_index: list[int | None]
+
+    @classmethod
+    def from_bars(cls, bars: list[Bar]) -> BarFrame:
+        """Transpose *bars* into columns."""
+        return cls(
+            open=[b.open for b in bars],
+            high=[b.high for b in bars],
+            low=[b.low for b in bars],
+            close=[b.close for b in bars],
+            volume=[b.volume for b in bars],
+            timestamp=[b.timestamp for b in bars],
+            symbol=[b.symbol for b in bars],
+            bar_index=[b.bar_index for b in bars],
+        )
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    def bar(self, i: int) -> Bar:
+        """Materialize row *i* as a Bar."""
+        return Bar(
+            self.open[i],
+            self.high[i],
+            self.low[i],
+            self.close[i],
+            self.volume[i],
+            self.timestamp[i],
+            self.symbol[i],
+            self.bar_index[i],
+        )
+
+
+# ---------------------------------------------------------------------------
+# Column-wise candle anatomy (same formulas as vpa_core.features)
+# ---------------------------------------------------------------------------
+
+
+def spreads(bf: BarFrame) -> list[float]:
+    """|close - open| per bar."""
+    return [abs(c - o) for o, c in zip(bf.open, bf.close)]
+
+
+bodies = spreads
+
+
+def ranges(bf: BarFrame) -> list[float]:
+    """high - low per bar."""
+    return [h - l for h, l in zip(bf.high, bf.low)]
+
+
+def upper_wicks(bf: BarFrame) -> list[float]:
+    """high - max(open, close) per bar."""
+    return [h - (c if c >= o else o) for o, h, c in zip(bf.open, bf.high, bf.close)]
+
+
+def lower_wicks(bf: BarFrame) -> list[float]:
+    """min(open, close) - low per bar."""
+    return [(o if c >= o else c) - l for o, l, c in zip(bf.open, bf.low, bf.close)]
+
+
+def close_locations(bf: BarFrame) -> list[str]:
+    """``features.close_location`` per bar: "upper" / "middle" / "lower" third."""
+    out: list[str] = []
+    append = out.append
+    for h, l, c in zip(bf.high, bf.low, bf.close):
+        if h == l:
+            append("middle")
+            continue
+        pos = (c - l) / (h - l)
+        append("upper" if pos >= 2 / 3 else "lower" if pos <= 1 / 3 else "middle")
+    return out
+
+
+@dataclass(frozen=True, slots=True)
+class AnatomyColumns:
+    """Per-bar candle anatomy for a BarFrame, one list per feature.
+
+    Element ``i`` of each column equals the matching ``vpa_core.features``
+    function applied to ``bf.bar(i)``.
+    """
+
+    spread: list[float]
+    range: list[float]
+    upper_wick: list[float]
+    lower_wick: list[float]
+    close_location: list[str]
+
+
+def anatomy(bf: BarFrame) -> AnatomyColumns:
+    """Compute every candle-anatomy column of *bf* in one call."""
+    return AnatomyColumns(
+        spread=spreads(bf),
+        range=ranges(bf),
+        upper_wick=upper_wicks(bf),
+        lower_wick=lower_wicks(bf),
+        close_location=close_locations(bf),
+    )
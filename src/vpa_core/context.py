@@ -5,6 +5,8 @@ Signals are interpreted in context (per book). Simple MVP: infer from
 recent bar closes. Pure functions; no I/O.
 """
 
+from operator import gt, lt
+
 from vpa_core.contracts import Bar
 
 # Simple labels for MVP; can extend (e.g. S/R) later.
@@ -22,11 +24,9 @@ def detect_context(bars: list[Bar], lookback: int = 5) -> str:
     """
     if not bars or len(bars) < lookback + 1:
         return CONTEXT_RANGE
-    window = bars[-lookback - 1 : -1]
-    ups = sum(1 for i in range(1, len(window)) if window[i].close > window[i - 1].close)
-    downs = sum(
-        1 for i in range(1, len(window)) if window[i].close < window[i - 1].close
-    )
+    closes = [b.close for b in bars[-lookback - 1 : -1]]
+    ups = sum(map(gt, closes[1:], closes[:-1]))
+    downs = sum(map(lt, closes[1:], closes[:-1]))
     if ups > downs and ups >= (lookback // 2) + 1:
         return CONTEXT_UPTREND
     if downs > ups and downs >= (lookback // 2) + 1:
@@ -9,7 +9,10 @@ Pure function; no I/O. Replaces the _build_context() stubs.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from collections import deque
+from functools import lru_cache
+from operator import gt, lt
+from typing import TYPE_CHECKING, NamedTuple
 
 from vpa_core.contracts import (
     Bar,
@@ -23,7 +26,57 @@ from vpa_core.contracts import (
 )
 
 if TYPE_CHECKING:
-    from config.vpa_config import VPAConfig
+    from config.vpa_config import TrendConfig, VPAConfig
+
+
+class _Columns(NamedTuple):
+    """Trailing bars as parallel columns (oldest first).
+
+    Built once per analyze() call so the detectors index plain lists
+    instead of loading attributes from every Bar in every window.
+    """
+
+    high: list[float]
+    low: list[float]
+    close: list[float]
+    volume: list[int]
+
+
+class _TrendParams(NamedTuple):
+    """TrendConfig flattened to locals-friendly scalars, plus the tail length."""
+
+    window_k: int
+    location_lookback: int
+    congestion_window: int
+    congestion_pct: float
+    tail_len: int
+
+
+@lru_cache(maxsize=16)
+def _trend_params(trend: TrendConfig) -> _TrendParams:
+    """Resolve the per-config window sizes once; analyze() runs every bar."""
+    return _TrendParams(
+        trend.window_K,
+        trend.location_lookback,
+        trend.congestion_window,
+        trend.congestion_pct,
+        max(trend.window_K + 1, trend.location_lookback, trend.congestion_window, 2),
+    )
+
+
+def history_needed(config: VPAConfig) -> int:
+    """Number of trailing bars analyze() reads; older bars never affect its result."""
+    return _trend_params(config.trend).tail_len
+
+
+def _columns(bars: list[Bar], n: int) -> _Columns:
+    tail = bars[-n:]
+    return _Columns(
+        [b.high for b in tail],
+        [b.low for b in tail],
+        [b.close for b in tail],
+        [b.volume for b in tail],
+    )
 
 
 def analyze(bars: list[Bar], config: VPAConfig, tf: str) -> ContextSnapshot:
@@ -43,13 +96,17 @@ def analyze(bars: list[Bar], config: VPAConfig, tf: str) -> ContextSnapshot:
     if len(bars) < 2:
         return _unknown_context(tf)
 
-    trend, strength = _detect_trend(bars, config.trend.window_K)
-    location = _detect_location(bars, config.trend.location_lookback)
-    congestion = _detect_congestion(
-        bars, config.trend.congestion_window,
-        config.trend.location_lookback, config.trend.congestion_pct,
-    )
-    vol_trend = _detect_volume_trend(bars, config.trend.window_K)
+    window_k, location_lookback, congestion_window, congestion_pct, tail_len = _trend_params(config.trend)
+    cols = _columns(bars, tail_len)
+    trend, strength, vol_trend = _detect_trends(cols, window_k)
+
+    # Location and congestion share the location_lookback range: scan it once.
+    n = len(cols.close)
+    start = n - location_lookback if 0 < location_lookback <= n else 0
+    highest = max(cols.high[start:])
+    lowest = min(cols.low[start:])
+    location = _detect_location(cols.close[-1], highest, lowest, n - start)
+    congestion = _detect_congestion(cols, congestion_window, highest - lowest, congestion_pct)
 
     return ContextSnapshot(
         tf=tf,
@@ -74,32 +131,161 @@ def _unknown_context(tf: str) -> ContextSnapshot:
     )
 
 
-def _detect_trend(bars: list[Bar], window_k: int) -> tuple[Trend, TrendStrength]:
-    """Determine trend direction and strength from recent closes.
+class ContextTracker:
+    """Incremental equivalent of analyze() for a series that grows one bar at a time.
 
-    Counts up-closes vs down-closes in a trailing window.
-    Strength is derived from the consistency ratio.
+    Feed every bar in order with update(); snapshot() then returns exactly
+    what analyze(bars_so_far, config, tf) would. Up/down counts are kept as
+    running sums over the window_K moves, and the rolling highs/lows sit in
+    monotonic deques, so each bar costs O(1) amortized instead of
+    re-scanning the lookback windows.
     """
-    lookback = min(window_k, len(bars) - 1)
+
+    def __init__(self, config: VPAConfig, tf: str) -> None:
+        p = _trend_params(config.trend)
+        self._tf = tf
+        self._window_k = p.window_k
+        self._loc_w = p.location_lookback if p.location_lookback > 0 else p.tail_len
+        self._cong_w = p.congestion_window if p.congestion_window > 0 else p.tail_len
+        self._congestion_pct = p.congestion_pct
+        self._count = 0
+        self._last_close = 0.0
+        self._last_volume = 0
+        # One (up, down, vol_up, vol_down) tuple per bar-to-bar move in the window.
+        self._moves: deque[tuple[bool, bool, bool, bool]] = deque()
+        self._ups = self._downs = self._vol_ups = self._vol_downs = 0
+        # (index, value) pairs; values monotonic so the front is the extreme.
+        self._loc_high: deque[tuple[int, float]] = deque()
+        self._loc_low: deque[tuple[int, float]] = deque()
+        self._cong_high: deque[tuple[int, float]] = deque()
+        self._cong_low: deque[tuple[int, float]] = deque()
+
+    def update(self, bar: Bar) -> None:
+        """Append the next bar (oldest first, no gaps)."""
+        i = self._count
+        if i > 0 and self._window_k > 0:
+            if len(self._moves) == self._window_k:
+                up, down, vup, vdown = self._moves.popleft()
+                self._ups -= up
+                self._downs -= down
+                self._vol_ups -= vup
+                self._vol_downs -= vdown
+            move = (
+                bar.close > self._last_close,
+                bar.close < self._last_close,
+                bar.volume > self._last_volume,
+                bar.volume < self._last_volume,
+            )
+            self._moves.append(move)
+            self._ups += move[0]
+            self._downs += move[1]
+            self._vol_ups += move[2]
+            self._vol_downs += move[3]
+        _push_max(self._loc_high, i, bar.high, self._loc_w)
+        _push_min(self._loc_low, i, bar.low, self._loc_w)
+        _push_max(self._cong_high, i, bar.high, self._cong_w)
+        _push_min(self._cong_low, i, bar.low, self._cong_w)
+        self._last_close = bar.close
+        self._last_volume = bar.volume
+        self._count = i + 1
+
+    def snapshot(self) -> ContextSnapshot:
+        """ContextSnapshot for all bars seen so far."""
+        n = self._count
+        if n < 2:
+            return _unknown_context(self._tf)
+
+        trend, strength = _trend_from_counts(self._ups, self._downs, len(self._moves))
+        if len(self._moves) < 1:
+            vol_trend = VolumeTrend.UNKNOWN
+        elif self._vol_ups > self._vol_downs:
+            vol_trend = VolumeTrend.RISING
+        elif self._vol_downs > self._vol_ups:
+            vol_trend = VolumeTrend.FALLING
+        else:
+            vol_trend = VolumeTrend.FLAT
+
+        highest = self._loc_high[0][1]
+        lowest = self._loc_low[0][1]
+        location = _detect_location(self._last_close, highest, lowest, min(n, self._loc_w))
+
+        cong_w = self._cong_w
+        if n < max(cong_w, 2):
+            congestion = Congestion(active=False)
+        else:
+            recent_high = self._cong_high[0][1]
+            recent_low = self._cong_low[0][1]
+            wider_range = highest - lowest
+            if wider_range <= 0:
+                congestion = Congestion(active=False)
+            else:
+                active = (recent_high - recent_low) / wider_range < self._congestion_pct
+                congestion = Congestion(active=active, range_high=recent_high, range_low=recent_low)
+
+        return ContextSnapshot(
+            tf=self._tf,
+            trend=trend,
+            trend_strength=strength,
+            trend_location=location,
+            congestion=congestion,
+            dominant_alignment=DominantAlignment.UNKNOWN,
+            volume_trend=vol_trend,
+        )
+
+
+def _push_max(dq: deque[tuple[int, float]], i: int, value: float, window: int) -> None:
+    while dq and dq[-1][1] <= value:
+        dq.pop()
+    dq.append((i, value))
+    if dq[0][0] <= i - window:
+        dq.popleft()
+
+
+def _push_min(dq: deque[tuple[int, float]], i: int, value: float, window: int) -> None:
+    while dq and dq[-1][1] >= value:
+        dq.pop()
+    dq.append((i, value))
+    if dq[0][0] <= i - window:
+        dq.popleft()
+
+
+def _detect_trends(cols: _Columns, window_k: int) -> tuple[Trend, TrendStrength, VolumeTrend]:
+    """Price trend (direction + strength) and volume trend in one pass.
+
+    Both use the same trailing window of ``window_k`` bar-to-bar changes:
+    up-closes vs down-closes give the price trend, with strength from the
+    consistency ratio; rising vs falling volume gives the volume trend.
+    """
+    closes = cols.close
+    volumes = cols.volume
+    lookback = min(window_k, len(closes) - 1)
     if lookback < 1:
-        return Trend.UNKNOWN, TrendStrength.WEAK
+        return Trend.UNKNOWN, TrendStrength.WEAK, VolumeTrend.UNKNOWN
+
+    # Count rises/falls by summing elementwise comparison results (bools)
+    # over shifted slices: no per-bar branches in the interpreter loop.
+    cur, prev = closes[-lookback:], closes[-lookback - 1:-1]
+    ups = sum(map(gt, cur, prev))
+    downs = sum(map(lt, cur, prev))
+    cur, prev = volumes[-lookback:], volumes[-lookback - 1:-1]
+    vol_ups = sum(map(gt, cur, prev))
+    vol_downs = sum(map(lt, cur, prev))
+
+    if vol_ups > vol_downs:
+        vol_trend = VolumeTrend.RISING
+    elif vol_downs > vol_ups:
+        vol_trend = VolumeTrend.FALLING
+    else:
+        vol_trend = VolumeTrend.FLAT
 
-    recent = bars[-(lookback + 1):]
-    ups = 0
-    downs = 0
-    for i in range(1, len(recent)):
-        if recent[i].close > recent[i - 1].close:
-            ups += 1
-        elif recent[i].close < recent[i - 1].close:
-            downs += 1
-
-    total = ups + downs
-    if total == 0:
-        return Trend.RANGE, TrendStrength.WEAK
+    trend, strength = _trend_from_counts(ups, downs, lookback)
+    return trend, strength, vol_trend
 
-    dominant = max(ups, downs)
-    ratio = dominant / lookback
 
+def _trend_from_counts(ups: int, downs: int, lookback: int) -> tuple[Trend, TrendStrength]:
+    """Trend direction from up/down close counts; strength from the consistency ratio."""
+    if lookback < 1:
+        return Trend.UNKNOWN, TrendStrength.WEAK
     if ups > downs:
         trend = Trend.UP
     elif downs > ups:
@@ -107,60 +293,30 @@ def _detect_trend(bars: list[Bar], window_k: int) -> tuple[Trend, TrendStrength]
     else:
         return Trend.RANGE, TrendStrength.WEAK
 
+    ratio = max(ups, downs) / lookback
     if ratio >= 0.80:
         strength = TrendStrength.STRONG
     elif ratio >= 0.60:
         strength = TrendStrength.MODERATE
     else:
         strength = TrendStrength.WEAK
-
     return trend, strength
 
 
-def _detect_volume_trend(bars: list[Bar], window_k: int) -> VolumeTrend:
-    """Determine volume trend direction from recent bar-to-bar volume changes.
-
-    Uses the same window as price trend for consistency. Counts bars where
-    volume increased vs decreased relative to the previous bar.
-    """
-    lookback = min(window_k, len(bars) - 1)
-    if lookback < 1:
-        return VolumeTrend.UNKNOWN
-
-    recent = bars[-(lookback + 1):]
-    ups = 0
-    downs = 0
-    for i in range(1, len(recent)):
-        if recent[i].volume > recent[i - 1].volume:
-            ups += 1
-        elif recent[i].volume < recent[i - 1].volume:
-            downs += 1
-
-    if ups > downs:
-        return VolumeTrend.RISING
-    if downs > ups:
-        return VolumeTrend.FALLING
-    return VolumeTrend.FLAT
-
-
-def _detect_location(bars: list[Bar], location_lookback: int) -> TrendLocation:
+def _detect_location(current_close: float, highest: float, lowest: float, window_len: int) -> TrendLocation:
     """Where the current close sits within the lookback price range.
 
     - Above 75th percentile → TOP
     - Below 25th percentile → BOTTOM
     - Otherwise → MIDDLE
     """
-    window = bars[-location_lookback:] if len(bars) >= location_lookback else bars
-    if len(window) < 2:
+    if window_len < 2:
         return TrendLocation.UNKNOWN
 
-    highest = max(b.high for b in window)
-    lowest = min(b.low for b in window)
     full_range = highest - lowest
     if full_range <= 0:
         return TrendLocation.MIDDLE
 
-    current_close = bars[-1].close
     pct = (current_close - lowest) / full_range
 
     if pct >= 0.75:
@@ -171,30 +327,24 @@ def _detect_location(bars: list[Bar], location_lookback: int) -> TrendLocation:
 
 
 def _detect_congestion(
-    bars: list[Bar],
+    cols: _Columns,
     congestion_window: int,
-    location_lookback: int,
+    wider_range: float,
     congestion_pct: float,
 ) -> Congestion:
     """Detect congestion by comparing recent range to lookback range.
 
     If the high-low range of the last `congestion_window` bars is less
-    than `congestion_pct` of the wider `location_lookback` range, the
-    market is in a tight congestion zone.
+    than `congestion_pct` of the wider `location_lookback` range
+    (``wider_range``), the market is in a tight congestion zone.
     """
-    if len(bars) < max(congestion_window, 2):
+    if len(cols.close) < max(congestion_window, 2):
         return Congestion(active=False)
 
-    recent = bars[-congestion_window:]
-    recent_high = max(b.high for b in recent)
-    recent_low = min(b.low for b in recent)
+    recent_high = max(cols.high[-congestion_window:])
+    recent_low = min(cols.low[-congestion_window:])
     recent_range = recent_high - recent_low
 
-    wider = bars[-location_lookback:] if len(bars) >= location_lookback else bars
-    wider_high = max(b.high for b in wider)
-    wider_low = min(b.low for b in wider)
-    wider_range = wider_high - wider_low
-
     if wider_range <= 0:
         return Congestion(active=False)
 
@@ -27,34 +27,77 @@ from vpa_core.contracts import (
     SignalEvent,
     TrendLocation,
 )
+from vpa_core.daily_context import compute_dominant_alignment
 
 if TYPE_CHECKING:
     from config.vpa_config import VPAConfig
 
 
-@dataclass(frozen=True)
+_CTX1_REASON = "CTX-1: trend location UNKNOWN — cannot assess anomaly significance"
+_CTX2_REASON = "CTX-2: dominant alignment AGAINST — counter-trend signal blocked (DISALLOW policy)"
+_CTX3_REASON = "CTX-3: anomaly signal in congestion zone — ambiguous, blocked"
+# Indexed by GateResult.reason_codes.
+_REASONS = (_CTX1_REASON, _CTX2_REASON, _CTX3_REASON)
+_CTX1, _CTX2, _CTX3 = range(3)
+
+
+@dataclass(frozen=True, slots=True)
 class GateResult:
-    """Output of the context gate stage — split into actionable and blocked."""
+    """Output of the context gate stage — split into actionable and blocked.
+
+    Blocked signals are recorded as positions in ``signals`` plus a parallel
+    gate code (0=CTX-1, 1=CTX-2, 2=CTX-3). ``blocked`` and ``block_reasons``
+    are derived from those on access, so callers that only consume
+    ``actionable`` (the pipeline, backtests) never format reason keys.
+    """
     actionable: list[SignalEvent] = field(default_factory=list)
-    blocked: list[SignalEvent] = field(default_factory=list)
-    block_reasons: dict[str, str] = field(default_factory=dict)
+    signals: tuple[SignalEvent, ...] = ()
+    blocked_idx: tuple[int, ...] = ()
+    reason_codes: tuple[int, ...] = ()
+
+    @property
+    def blocked(self) -> list[SignalEvent]:
+        """Blocked signals, in input order."""
+        signals = self.signals
+        return [signals[i] for i in self.blocked_idx]
+
+    @property
+    def block_reasons(self) -> dict[str, str]:
+        """Reason per blocked signal, keyed by ``block_key()``."""
+        reasons: dict[str, str] = {}
+        # Signals from one bar share a timestamp; format it once per run of equal ts.
+        last_ts = None
+        ts_iso = ""
+        for i, code in zip(self.blocked_idx, self.reason_codes):
+            signal = self.signals[i]
+            if signal.ts != last_ts:
+                last_ts = signal.ts
+                ts_iso = last_ts.isoformat()
+            reasons[block_key(signal, ts_iso)] = _REASONS[code]
+        return reasons
+
+
+def block_key(signal: SignalEvent, ts_iso: str | None = None) -> str:
+    """Key under which ``GateResult.block_reasons`` stores *signal*'s reason.
+
+    ``ts_iso`` may be passed when the caller already has ``signal.ts.isoformat()``.
+    """
+    return f"{signal.id}@{ts_iso if ts_iso is not None else signal.ts.isoformat()}"
 
 
-def _check_ctx_1(signal: SignalEvent, context: ContextSnapshot, config: VPAConfig) -> str | None:
-    """CTX-1: if the signal requires a context gate and trend location is UNKNOWN, block it.
+def _ctx_1_blocks(context: ContextSnapshot, config: VPAConfig) -> bool:
+    """True when CTX-1 blocks every gated signal for this context.
 
-    Returns a reason string if blocked, None if passed.
+    Depends only on the config toggle and the trend location, neither of
+    which varies per signal (daily enrichment only touches alignment).
     """
-    if not config.gates.ctx1_trend_location_required:
-        return None
-    if not signal.requires_context_gate:
-        return None
-    if context.trend_location == TrendLocation.UNKNOWN:
-        return "CTX-1: trend location UNKNOWN — cannot assess anomaly significance"
-    return None
+    return (
+        config.gates.ctx1_trend_location_required
+        and context.trend_location == TrendLocation.UNKNOWN
+    )
 
 
-def _check_ctx_2(signal: SignalEvent, context: ContextSnapshot, config: VPAConfig) -> str | None:
+def _ctx_2_disallows(config: VPAConfig) -> bool:
     """CTX-2: dominant alignment gate.
 
     Policy-driven behavior (config.gates.ctx2_dominant_alignment_policy):
@@ -62,18 +105,12 @@ def _check_ctx_2(signal: SignalEvent, context: ContextSnapshot, config: VPAConfi
         REDUCE_RISK — pass through (Risk Engine handles sizing reduction).
         ALLOW — no action.
 
-    Returns a reason string if blocked, None if passed.
+    Only DISALLOW can block; alignment itself is resolved per signal.
     """
-    if config.gates.ctx2_dominant_alignment_policy != "DISALLOW":
-        return None
-    if not signal.requires_context_gate:
-        return None
-    if context.dominant_alignment == DominantAlignment.AGAINST:
-        return "CTX-2: dominant alignment AGAINST — counter-trend signal blocked (DISALLOW policy)"
-    return None
+    return config.gates.ctx2_dominant_alignment_policy == "DISALLOW"
 
 
-def _check_ctx_3(signal: SignalEvent, context: ContextSnapshot, config: VPAConfig) -> str | None:
+def _ctx_3_blocks_anomalies(context: ContextSnapshot, config: VPAConfig) -> bool:
     """CTX-3: congestion awareness gate.
 
     When the market is range-bound, anomaly signals are ambiguous —
@@ -83,18 +120,8 @@ def _check_ctx_3(signal: SignalEvent, context: ContextSnapshot, config: VPAConfi
     Non-anomaly signals (VALIDATION, TEST, STRENGTH, WEAKNESS,
     CONFIRMATION) pass through — they may indicate breakout activity
     or range boundary probes.
-
-    Returns a reason string if blocked, None if passed.
     """
-    if not config.gates.ctx3_congestion_awareness_required:
-        return None
-    if not signal.requires_context_gate:
-        return None
-    if not context.congestion.active:
-        return None
-    if signal.signal_class == SignalClass.ANOMALY:
-        return "CTX-3: anomaly signal in congestion zone — ambiguous, blocked"
-    return None
+    return config.gates.ctx3_congestion_awareness_required and context.congestion.active
 
 
 def apply_gates(
@@ -130,42 +157,59 @@ def apply_gates(
     GateResult
         Frozen dataclass with ``actionable``, ``blocked``, and ``block_reasons``.
     """
-    actionable: list[SignalEvent] = []
-    blocked: list[SignalEvent] = []
-    reasons: dict[str, str] = {}
-
-    gate_checks = [_check_ctx_1, _check_ctx_2, _check_ctx_3]
-
-    for signal in signals:
-        effective_context = _enrich_for_signal(context, daily_context, signal)
+    # Every gate input except per-signal alignment is invariant across the
+    # signal list: resolve it all to plain bools once, then the loop body is
+    # just flag tests.
+    ctx1_blocks = _ctx_1_blocks(context, config)
+    ctx2_on = _ctx_2_disallows(config)
+    # Without daily context every signal shares the snapshot's alignment.
+    ctx2_blocks_all = (
+        ctx2_on and daily_context is None
+        and context.dominant_alignment == DominantAlignment.AGAINST
+    )
+    ctx2_per_signal = ctx2_on and daily_context is not None
+    ctx3_blocks = _ctx_3_blocks_anomalies(context, config)
 
-        block_reason: str | None = None
-        for check in gate_checks:
-            block_reason = check(signal, effective_context, config)
-            if block_reason is not None:
-                break
+    # Fast path: no gate can fire for this context, or nothing is gated.
+    if not (ctx1_blocks or ctx2_blocks_all or ctx2_per_signal or ctx3_blocks) or not any(
+        s.requires_context_gate for s in signals
+    ):
+        return GateResult(actionable=list(signals))
 
-        if block_reason is not None:
-            blocked.append(signal)
-            key = f"{signal.id}@{signal.ts.isoformat()}"
-            reasons[key] = block_reason
+    actionable: list[SignalEvent] = []
+    blocked_idx: list[int] = []
+    reason_codes: list[int] = []
+    # Enum members bound once: the class attribute lookup costs more than the compare.
+    against, anomaly = DominantAlignment.AGAINST, SignalClass.ANOMALY
+
+    # Ungated signals go straight through; they are not split out up front
+    # because actionable must keep the input order for the composer.
+    for i, signal in enumerate(signals):
+        if not signal.requires_context_gate:
+            actionable.append(signal)
+            continue
+
+        if ctx1_blocks:
+            code = _CTX1
+        elif ctx2_blocks_all or (
+            ctx2_per_signal
+            and compute_dominant_alignment(daily_context, signal.direction_bias) == against
+        ):
+            code = _CTX2
+        elif ctx3_blocks and signal.signal_class == anomaly:
+            code = _CTX3
         else:
             actionable.append(signal)
+            continue
 
+        blocked_idx.append(i)
+        reason_codes.append(code)
+
+    if not blocked_idx:
+        return GateResult(actionable=actionable)
     return GateResult(
         actionable=actionable,
-        blocked=blocked,
-        block_reasons=reasons,
+        signals=tuple(signals),
+        blocked_idx=tuple(blocked_idx),
+        reason_codes=tuple(reason_codes),
     )
-
-
-def _enrich_for_signal(
-    context: ContextSnapshot,
-    daily_context: ContextSnapshot | None,
-    signal: SignalEvent,
-) -> ContextSnapshot:
-    """Resolve per-signal dominant alignment when daily context is available."""
-    if daily_context is None:
-        return context
-    from vpa_core.daily_context import enrich_context_with_daily
-    return enrich_context_with_daily(context, daily_context, signal.direction_bias)
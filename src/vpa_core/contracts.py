@@ -117,7 +117,7 @@ class TradeIntentStatus(str, Enum):
     REJECTED = "REJECTED"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Bar:
     """OHLCV bar; timestamps in UTC. No indicator fields."""
 
@@ -138,9 +138,7 @@ class Bar:
         """
         return abs(self.close - self.open)
 
-    def body(self) -> float:
-        """Alias for spread(): absolute difference between open and close."""
-        return abs(self.close - self.open)
+    body = spread  # alias: the candle body *is* the spread
 
     def bar_range(self) -> float:
         """Full extent of the candle: high - low."""
@@ -151,7 +149,7 @@ class Bar:
         return self.close > self.open
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ContextWindow:
     """Input to vpa-core: ordered bars (oldest first), no lookahead."""
 
@@ -171,7 +169,7 @@ class ContextWindow:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CandleFeatures:
     """Computed features for a single bar. Output of Feature Engine (stage 2).
 
@@ -191,7 +189,7 @@ class CandleFeatures:
     candle_type: CandleType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Congestion:
     """Congestion/range zone within a ContextSnapshot."""
 
@@ -200,7 +198,7 @@ class Congestion:
     range_low: float | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ContextSnapshot:
     """Context for a timeframe at a point in time. Output of Context Engine (stage 4).
 
@@ -216,7 +214,7 @@ class ContextSnapshot:
     volume_trend: VolumeTrend = VolumeTrend.UNKNOWN
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SignalEvent:
     """Atomic signal emitted by Rule Engine (stage 5). No orders, no sizing.
 
@@ -234,7 +232,7 @@ class SignalEvent:
     requires_context_gate: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EntryPlan:
     """Entry timing and order type within a TradeIntent."""
 
@@ -242,7 +240,7 @@ class EntryPlan:
     order_type: str = "MARKET"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RiskPlan:
     """Stop, size, and risk parameters within a TradeIntent."""
 
@@ -251,7 +249,7 @@ class RiskPlan:
     size: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TradeIntent:
     """Output of Risk Engine (stage 8). Approved or rejected trade candidate.
 
@@ -274,7 +272,7 @@ class TradeIntent:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Signal:
     """DEPRECATED: Use SignalEvent for new code.
 
@@ -290,7 +288,7 @@ class Signal:
     strength: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TradePlan:
     """DEPRECATED: Use TradeIntent for new code.
 
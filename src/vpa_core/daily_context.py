@@ -14,9 +14,12 @@ backdrop. Intraday signals that agree with the daily trend are
 
 from __future__ import annotations
 
+from dataclasses import replace
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from vpa_core.context_engine import analyze as analyze_context
+from vpa_core.context_engine import history_needed
 from vpa_core.contracts import (
     Bar,
     ContextSnapshot,
@@ -49,8 +52,19 @@ def compute_daily_context(daily_bars: list[Bar], config: VPAConfig) -> ContextSn
         Daily-timeframe context with trend, location, congestion.
         ``dominant_alignment`` is left UNKNOWN here — call
         ``compute_dominant_alignment`` to resolve it per signal.
+
+    Memoized on the trailing bars the context engine actually reads (plus
+    config), so repeated calls on an unchanged daily series — e.g. every
+    scheduler cycle within a session — reuse the snapshot, while a new or
+    revised daily bar changes the key.
     """
-    return analyze_context(daily_bars, config, tf="1d")
+    tail = tuple(daily_bars[-history_needed(config):])
+    return _daily_context_for_tail(tail, config)
+
+
+@lru_cache(maxsize=16)
+def _daily_context_for_tail(tail: tuple[Bar, ...], config: VPAConfig) -> ContextSnapshot:
+    return analyze_context(list(tail), config, tf="1d")
 
 
 def compute_dominant_alignment(
@@ -72,25 +86,25 @@ def compute_dominant_alignment(
         The signal's ``direction_bias`` string, e.g. "BULLISH",
         "BEARISH", "BEARISH_OR_WAIT". Only the leading word is used.
     """
-    daily_trend = daily_context.trend
+    return _ALIGNMENT.get(
+        (_bias_word(signal_direction_bias), daily_context.trend),
+        DominantAlignment.UNKNOWN,
+    )
 
-    if daily_trend in (Trend.UNKNOWN, Trend.RANGE):
-        return DominantAlignment.UNKNOWN
 
-    bias = signal_direction_bias.upper().split("_")[0]
-    if bias not in ("BULLISH", "BEARISH"):
-        return DominantAlignment.UNKNOWN
+# (leading bias word, daily trend) -> alignment; every other pair is UNKNOWN.
+_ALIGNMENT: dict[tuple[str, Trend], DominantAlignment] = {
+    ("BULLISH", Trend.UP): DominantAlignment.WITH,
+    ("BEARISH", Trend.DOWN): DominantAlignment.WITH,
+    ("BULLISH", Trend.DOWN): DominantAlignment.AGAINST,
+    ("BEARISH", Trend.UP): DominantAlignment.AGAINST,
+}
 
-    if bias == "BULLISH" and daily_trend == Trend.UP:
-        return DominantAlignment.WITH
-    if bias == "BEARISH" and daily_trend == Trend.DOWN:
-        return DominantAlignment.WITH
-    if bias == "BULLISH" and daily_trend == Trend.DOWN:
-        return DominantAlignment.AGAINST
-    if bias == "BEARISH" and daily_trend == Trend.UP:
-        return DominantAlignment.AGAINST
 
-    return DominantAlignment.UNKNOWN
+@lru_cache(maxsize=64)
+def _bias_word(direction_bias: str) -> str:
+    """Leading word of a direction_bias, e.g. "BEARISH_OR_WAIT" -> "BEARISH"."""
+    return direction_bias.upper().split("_")[0]
 
 
 def enrich_context_with_daily(
@@ -100,18 +114,14 @@ def enrich_context_with_daily(
 ) -> ContextSnapshot:
     """Return an updated intraday context with dominant alignment resolved.
 
-    Creates a new ContextSnapshot identical to ``intraday_context``
-    but with ``dominant_alignment`` set based on the daily trend
-    and the signal's directional bias.
+    Returns a ContextSnapshot identical to ``intraday_context`` (all
+    fields, including ``volume_trend``) but with ``dominant_alignment``
+    set based on the daily trend and the signal's directional bias.
+    The input is returned as-is when the alignment already matches.
 
     This is the entry point used by the pipeline to merge timeframes.
     """
     alignment = compute_dominant_alignment(daily_context, signal_direction_bias)
-    return ContextSnapshot(
-        tf=intraday_context.tf,
-        trend=intraday_context.trend,
-        trend_strength=intraday_context.trend_strength,
-        trend_location=intraday_context.trend_location,
-        congestion=intraday_context.congestion,
-        dominant_alignment=alignment,
-    )
+    if alignment == intraday_context.dominant_alignment:
+        return intraday_context
+    return replace(intraday_context, dominant_alignment=alignment)
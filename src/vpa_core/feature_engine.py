@@ -10,22 +10,27 @@ use rolling averages from config-specified windows.
 
 from __future__ import annotations
 
+from datetime import datetime
+
+from vpa_core.barframe import BarFrame, lower_wicks, ranges, spreads, upper_wicks
 from vpa_core.contracts import Bar, CandleFeatures, CandleType
 from vpa_core.features import (
     average_spread,
-    bar_range,
+    average_spread_col,
     classify_spread,
-    lower_wick,
-    spread,
-    spread_rel,
-    upper_wick,
+    classify_spread_batch,
 )
-from vpa_core.relative_volume import average_volume, classify_volume, vol_rel
+from vpa_core.relative_volume import average_volume, classify_volume, classify_volume_batch
 
 from config.vpa_config import VPAConfig
 
 
-def extract_features(bars: list[Bar], config: VPAConfig, tf: str) -> CandleFeatures:
+def extract_features(
+    bars: list[Bar],
+    config: VPAConfig,
+    tf: str,
+    vol_avg: float | None = None,
+) -> CandleFeatures:
     """Extract canonical CandleFeatures for the last bar in *bars*.
 
     Parameters
@@ -37,6 +42,10 @@ def extract_features(bars: list[Bar], config: VPAConfig, tf: str) -> CandleFeatu
         VPA configuration with window sizes and classification thresholds.
     tf:
         Timeframe label (e.g. "15m", "1h").
+    vol_avg:
+        Precomputed volume baseline (``average_volume(bars,
+        config.vol.avg_window_N)``), e.g. from a RollingVolume. Computed
+        from *bars* when omitted.
 
     Returns
     -------
@@ -52,33 +61,113 @@ def extract_features(bars: list[Bar], config: VPAConfig, tf: str) -> CandleFeatu
         raise ValueError("extract_features requires at least one bar")
 
     current = bars[-1]
+    if vol_avg is None:
+        vol_avg = average_volume(bars, lookback=config.vol.avg_window_N)
+    spread_avg = average_spread(bars, lookback=config.spread.avg_window_M)
+    return _features_from_baselines(
+        current.open, current.high, current.low, current.close,
+        current.volume, current.timestamp, vol_avg, spread_avg, config, tf,
+    )
 
-    bar_spread = spread(current)
-    bar_rng = bar_range(current)
-    bar_upper_wick = upper_wick(current)
-    bar_lower_wick = lower_wick(current)
 
-    vol_avg = average_volume(bars, lookback=config.vol.avg_window_N)
-    computed_vol_rel = vol_rel(current.volume, vol_avg) if vol_avg > 0 else 0.0
+def extract_features_batch(
+    bars: list[Bar] | BarFrame,
+    config: VPAConfig,
+    tf: str,
+) -> list[CandleFeatures]:
+    """Extract CandleFeatures for every bar in *bars* in one pass.
 
-    spread_avg = average_spread(bars, lookback=config.spread.avg_window_M)
-    computed_spread_rel = spread_rel(current, spread_avg) if spread_avg > 0 else 0.0
-
-    vol_state = classify_volume(computed_vol_rel, config)
-    spread_state = classify_spread(computed_spread_rel, config)
+    Element ``i`` equals ``extract_features(bars[: i + 1], config, tf)``.
+    Works on BarFrame columns (a list[Bar] is transposed first). The
+    volume baseline is a running window sum (exact for integer volumes)
+    and the spread baseline is summed in the same order as
+    ``average_spread``, so results match the per-bar path bit for bit.
+    Returns an empty list for no bars.
+    """
+    bf = bars if isinstance(bars, BarFrame) else BarFrame.from_bars(bars)
+    n_vol = config.vol.avg_window_N
+    n_spread = config.spread.avg_window_M
+    volumes = bf.volume
+    bar_spreads = spreads(bf)
+    n = len(bf)
+
+    vol_rels = [0.0] * n
+    spread_rels = [0.0] * n
+    vol_sum = 0
+    for i in range(1, n):
+        if n_vol > 0:
+            vol_sum += volumes[i - 1]
+            if i - 1 - n_vol >= 0:
+                vol_sum -= volumes[i - 1 - n_vol]
+            vol_avg = vol_sum / min(i, n_vol)
+            if vol_avg > 0:
+                vol_rels[i] = volumes[i] / vol_avg
+        spread_avg = average_spread_col(bar_spreads, i, n_spread)
+        if spread_avg > 0:
+            spread_rels[i] = bar_spreads[i] / spread_avg
+
+    vol_states = classify_volume_batch(vol_rels, config)
+    spread_states = classify_spread_batch(spread_rels, config)
+    up, down = CandleType.UP, CandleType.DOWN
+
+    return [
+        CandleFeatures(
+            ts=ts,
+            tf=tf,
+            spread=sp,
+            range=rng,
+            upper_wick=uw,
+            lower_wick=lw,
+            spread_rel=sr,
+            vol_rel=vr,
+            vol_state=vs,
+            spread_state=ss,
+            candle_type=up if c >= o else down,
+        )
+        for ts, o, c, sp, rng, uw, lw, sr, vr, vs, ss in zip(
+            bf.timestamp, bf.open, bf.close, bar_spreads, ranges(bf), upper_wicks(bf),
+            lower_wicks(bf), spread_rels, vol_rels, vol_states, spread_states,
+        )
+    ]
+
+
+def _features_from_baselines(
+    o: float,
+    h: float,
+    l: float,
+    c: float,
+    volume: int | float,
+    ts: datetime,
+    vol_avg: float,
+    spread_avg: float,
+    config: VPAConfig,
+    tf: str,
+) -> CandleFeatures:
+    """Build CandleFeatures for one bar's OHLCV values given its rolling baselines.
+
+    Candle anatomy is computed inline (same formulas as ``features.spread``/
+    ``bar_range``/``upper_wick``/``lower_wick``) so the per-bar path makes
+    no helper calls and works equally from a Bar or from BarFrame columns.
+    """
+    bar_spread = abs(c - o)
+    if c >= o:
+        body_top, body_bottom, candle_type = c, o, CandleType.UP
+    else:
+        body_top, body_bottom, candle_type = o, c, CandleType.DOWN
 
-    candle_type = CandleType.UP if current.close >= current.open else CandleType.DOWN
+    computed_vol_rel = volume / vol_avg if vol_avg > 0 else 0.0
+    computed_spread_rel = bar_spread / spread_avg if spread_avg > 0 else 0.0
 
     return CandleFeatures(
-        ts=current.timestamp,
+        ts=ts,
         tf=tf,
         spread=bar_spread,
-        range=bar_rng,
-        upper_wick=bar_upper_wick,
-        lower_wick=bar_lower_wick,
+        range=h - l,
+        upper_wick=h - body_top,
+        lower_wick=body_bottom - l,
         spread_rel=computed_spread_rel,
         vol_rel=computed_vol_rel,
-        vol_state=vol_state,
-        spread_state=spread_state,
+        vol_state=classify_volume(computed_vol_rel, config),
+        spread_state=classify_spread(computed_spread_rel, config),
         candle_type=candle_type,
     )
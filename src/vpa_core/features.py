@@ -36,9 +36,7 @@ def spread(bar: Bar) -> float:
     return abs(bar.close - bar.open)
 
 
-def body(bar: Bar) -> float:
-    """Alias for spread(): absolute difference between open and close."""
-    return abs(bar.close - bar.open)
+body = spread  # alias: the candle body *is* the spread
 
 
 def bar_range(bar: Bar) -> float:
@@ -48,12 +46,14 @@ def bar_range(bar: Bar) -> float:
 
 def upper_wick(bar: Bar) -> float:
     """Upper wick: high - max(open, close)."""
-    return bar.high - max(bar.open, bar.close)
+    o, c = bar.open, bar.close
+    return bar.high - (c if c > o else o)  # max() semantics without the builtin call
 
 
 def lower_wick(bar: Bar) -> float:
     """Lower wick: min(open, close) - low."""
-    return min(bar.open, bar.close) - bar.low
+    o, c = bar.open, bar.close
+    return (c if c < o else o) - bar.low  # min() semantics without the builtin call
 
 
 def close_location(bar: Bar) -> str:
@@ -79,12 +79,25 @@ def average_spread(bars: list[Bar], lookback: int) -> float:
 
     Mirrors ``average_volume`` in relative_volume.py — same windowing logic.
     """
-    if lookback <= 0 or not bars or len(bars) < 2:
+    n = len(bars)
+    if lookback <= 0 or n < 2:
+        return 0.0
+    start = n - 1 - lookback if n > lookback + 1 else 0
+    return sum(map(spread, bars[start : n - 1])) / (n - 1 - start)
+
+
+def average_spread_col(spreads: list[float], i: int, lookback: int) -> float:
+    """``average_spread(bars[: i + 1], lookback)`` from a precomputed spread column.
+
+    For batch callers that already hold ``|close - open|`` per bar (see
+    ``barframe.spreads``): no Bar attribute loads or per-bar abs(). The
+    window is summed with ``sum()`` over the same values in the same order,
+    so the result equals ``average_spread`` exactly.
+    """
+    if lookback <= 0 or i < 1:
         return 0.0
-    window = bars[-(lookback + 1) : -1] if len(bars) > lookback + 1 else bars[:-1]
-    if not window:
-        return spread(bars[-1]) if bars else 0.0
-    return sum(spread(b) for b in window) / len(window)
+    start = i - lookback if i > lookback else 0
+    return sum(spreads[start:i]) / (i - start)
 
 
 def spread_rel(bar: Bar, baseline_avg: float) -> float:
@@ -113,3 +126,17 @@ def classify_spread(spread_rel_value: float, config: VPAConfig) -> SpreadState:
     if spread_rel_value < t.narrow_lt:
         return SpreadState.NARROW
     return SpreadState.NORMAL
+
+
+def classify_spread_batch(spread_rel_values: list[float], config: VPAConfig) -> list[SpreadState]:
+    """Vectorized ``classify_spread``: one SpreadState per value, same precedence.
+
+    Thresholds are read once for the whole column.
+    """
+    t = config.spread.thresholds
+    wide_gt, narrow_lt = t.wide_gt, t.narrow_lt
+    wide, narrow, normal = SpreadState.WIDE, SpreadState.NARROW, SpreadState.NORMAL
+    return [
+        wide if x > wide_gt else narrow if x < narrow_lt else normal
+        for x in spread_rel_values
+    ]
@@ -7,6 +7,8 @@ Matches VPA_SIGNAL_FLOW.md stage ordering.
 
 from __future__ import annotations
 
+from collections import deque
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
@@ -18,9 +20,10 @@ from vpa_core.contracts import (
     TradeIntent,
 )
 from vpa_core.atr import compute_atr
+from vpa_core.context_engine import ContextTracker
 from vpa_core.context_gates import GateResult, apply_gates
 from vpa_core.feature_engine import extract_features
-from vpa_core.relative_volume import average_volume
+from vpa_core.relative_volume import RollingVolume, average_volume
 from vpa_core.risk_engine import AccountState, evaluate_risk
 from vpa_core.rule_engine import (
     detect_conf_2,
@@ -35,7 +38,7 @@ if TYPE_CHECKING:
     from config.vpa_config import VPAConfig
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PipelineResult:
     """Complete output of one bar's pipeline evaluation.
 
@@ -60,6 +63,7 @@ def run_pipeline(
     composer: SetupComposer,
     tf: str = "15m",
     daily_context: ContextSnapshot | None = None,
+    atr_value: float | None = None,
 ) -> PipelineResult:
     """Process one bar through the full VPA pipeline.
 
@@ -90,6 +94,10 @@ def run_pipeline(
         Optional daily-timeframe ContextSnapshot for multi-timeframe
         analysis. When provided, CTX-2 resolves per-signal dominant
         alignment based on the daily trend.
+    atr_value:
+        Precomputed ATR for the current bar (e.g. from an ATRState kept
+        by the caller). When omitted and ATR is enabled, it is computed
+        from *bars*.
 
     Returns
     -------
@@ -99,46 +107,133 @@ def run_pipeline(
     if not bars:
         return PipelineResult(bar_index=bar_index)
 
-    features = extract_features(bars, config, tf)
+    features, signals = _evaluate_signals(bars, context, config, tf)
+    if signals is None:
+        return PipelineResult(bar_index=bar_index, features=features)
 
-    if config.volume_guard.enabled:
-        avg_vol = average_volume(bars, lookback=config.vol.avg_window_N)
-        if avg_vol < config.volume_guard.min_avg_volume:
-            return PipelineResult(bar_index=bar_index, features=features)
+    gate_result = apply_gates(signals, context, config, daily_context=daily_context)
+
+    matches = composer.process_signals(gate_result.actionable, bar_index, context)
+
+    intents: list[TradeIntent] = []
+    if matches:
+        # ATR only feeds stop placement, so bars without a match skip it.
+        current_price = bars[-1].close
+        atr_cfg = config.atr
+        if not atr_cfg.enabled:
+            atr_value = 0.0
+        elif atr_value is None:
+            atr_value = compute_atr(bars, period=atr_cfg.period)
+        intents = [
+            evaluate_risk(match, current_price, account, context, config, atr_value=atr_value)
+            for match in matches
+        ]
+
+    return PipelineResult(
+        bar_index=bar_index,
+        features=features,
+        signals=signals,
+        gate_result=gate_result,
+        matches=matches,
+        intents=intents,
+        daily_context=daily_context,
+    )
+
+
+def _evaluate_signals(
+    bars: list[Bar],
+    context: ContextSnapshot,
+    config: VPAConfig,
+    tf: str,
+    vol_avg: float | None = None,
+) -> tuple[CandleFeatures, list[SignalEvent] | None]:
+    """Stages 1-2: features and every rule family for the last bar.
+
+    The volume baseline (*vol_avg*, computed from *bars* when omitted) is
+    shared by the feature engine and the volume guard, which use the same
+    window. Returns ``(features, None)`` when the volume guard suppresses
+    the bar.
+    """
+    if vol_avg is None:
+        vol_avg = average_volume(bars, lookback=config.vol.avg_window_N)
+    features = extract_features(bars, config, tf, vol_avg=vol_avg)
+
+    guard = config.volume_guard
+    if guard.enabled and vol_avg < guard.min_avg_volume:
+        return features, None
 
     bar_signals = evaluate_rules(features, config)
     trend_signals = evaluate_trend_rules(context, config)
     cluster_signals = evaluate_cluster_rules(bars, config, tf)
 
-    conf_2 = detect_conf_2(bar_signals, trend_signals + cluster_signals, config)
+    conf_2 = None
+    if bar_signals and (trend_signals or cluster_signals):
+        conf_2 = detect_conf_2(bar_signals, trend_signals + cluster_signals, config)
     avoidance_signals = evaluate_avoidance_rules(bar_signals, context, config)
-    signals = bar_signals + trend_signals + cluster_signals + avoidance_signals
+
+    # Every rule family returns a fresh list, so grow bar_signals in place
+    # (once the detectors above are done reading it) instead of concatenating.
+    signals = bar_signals
+    signals += trend_signals
+    signals += cluster_signals
+    signals += avoidance_signals
     if conf_2 is not None:
         signals.append(conf_2)
 
+    # Stop placement reads the trigger bar's extremes from evidence.
     current_bar = bars[-1]
+    bar_low = current_bar.low
+    bar_high = current_bar.high
     for sig in signals:
-        sig.evidence.setdefault("bar_low", current_bar.low)
-        sig.evidence.setdefault("bar_high", current_bar.high)
-
-    gate_result = apply_gates(signals, context, config, daily_context=daily_context)
+        evidence = sig.evidence
+        evidence.setdefault("bar_low", bar_low)
+        evidence.setdefault("bar_high", bar_high)
 
-    matches = composer.process_signals(gate_result.actionable, bar_index, context)
+    return features, signals
 
-    current_price = bars[-1].close
-    atr_value = compute_atr(bars, period=config.atr.period) if config.atr.enabled else 0.0
 
-    intents: list[TradeIntent] = []
-    for match in matches:
-        intent = evaluate_risk(match, current_price, account, context, config, atr_value=atr_value)
-        intents.append(intent)
+def history_needed(config: VPAConfig) -> int:
+    """Trailing bars the feature, volume-guard and cluster-rule stages read.
 
-    return PipelineResult(
-        bar_index=bar_index,
-        features=features,
-        signals=signals,
-        gate_result=gate_result,
-        matches=matches,
-        intents=intents,
-        daily_context=daily_context,
+    Anything older cannot change a bar's signals, so a streaming caller
+    only has to keep this many bars.
+    """
+    avg_n = config.vol.avg_window_N
+    return max(
+        avg_n + 1,
+        config.spread.avg_window_M + 1,
+        config.trend.window_K + avg_n,
     )
+
+
+def stream_actionable(
+    bars: Iterable[Bar],
+    config: VPAConfig,
+    tf: str = "15m",
+    daily_context: ContextSnapshot | None = None,
+) -> Iterator[tuple[int, list[SignalEvent]]]:
+    """Fused Features -> Rules -> Gates pass over a bar stream.
+
+    Yields ``(bar_index, actionable_signals)`` for each bar that produced
+    at least one actionable signal — the same signals ``run_pipeline``
+    would hand the composer for that bar. Context is maintained
+    incrementally (ContextTracker) and only ``history_needed(config)``
+    bars are retained, so memory stays constant however long the stream
+    is. The volume baseline is a RollingVolume, so it costs O(1) per bar.
+    No CandleFeatures, PipelineResult or blocked-signal lists are kept.
+    """
+    history: deque[Bar] = deque(maxlen=history_needed(config))
+    tracker = ContextTracker(config, tf)
+    volumes = RollingVolume(config.vol.avg_window_N)
+    for bar_index, bar in enumerate(bars):
+        history.append(bar)
+        tracker.update(bar)
+        context = tracker.snapshot()
+        vol_avg = volumes.average()
+        volumes.push(bar.volume)
+        _, signals = _evaluate_signals(list(history), context, config, tf, vol_avg)
+        if not signals:
+            continue
+        actionable = apply_gates(signals, context, config, daily_context=daily_context).actionable
+        if actionable:
+            yield bar_index, actionable
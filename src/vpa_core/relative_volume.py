@@ -10,6 +10,8 @@ driven by VPAConfig thresholds (docs/vpa/VPA_CONFIG.md §2.1).
 
 from __future__ import annotations
 
+from collections import deque
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 from vpa_core.contracts import Bar, RelativeVolume, VolumeState
@@ -22,15 +24,49 @@ if TYPE_CHECKING:
 # Shared helpers
 # ---------------------------------------------------------------------------
 
+_volume = attrgetter("volume")
+
 
 def average_volume(bars: list[Bar], lookback: int) -> float:
     """Average volume over the last ``lookback`` bars (excluding current)."""
-    if lookback <= 0 or not bars or len(bars) < 2:
+    n = len(bars)
+    if lookback <= 0 or n < 2:
         return 0.0
-    window = bars[-(lookback + 1) : -1] if len(bars) > lookback + 1 else bars[:-1]
-    if not window:
-        return float(bars[-1].volume) if bars else 0.0
-    return sum(b.volume for b in window) / len(window)
+    start = n - 1 - lookback if n > lookback + 1 else 0
+    return sum(map(_volume, bars[start : n - 1])) / (n - 1 - start)
+
+
+class RollingVolume:
+    """Running ``average_volume`` baseline for a bar stream, O(1) per bar.
+
+    Call ``average()`` for the current bar *before* ``push``-ing its
+    volume: the result equals ``average_volume(bars, lookback)`` over the
+    bars pushed so far plus the current one. The window total is kept as a
+    running sum, which is exact for integer volumes.
+    """
+
+    __slots__ = ("_lookback", "_window", "_total")
+
+    def __init__(self, lookback: int) -> None:
+        self._lookback = lookback
+        self._window: deque[int | float] = deque()
+        self._total: int | float = 0
+
+    def average(self) -> float:
+        """Mean of the last ``lookback`` pushed volumes; 0.0 when there are none."""
+        if self._lookback <= 0 or not self._window:
+            return 0.0
+        return self._total / len(self._window)
+
+    def push(self, volume: int | float) -> None:
+        """Add the just-processed bar's volume to the baseline window."""
+        if self._lookback <= 0:
+            return
+        window = self._window
+        window.append(volume)
+        self._total += volume
+        if len(window) > self._lookback:
+            self._total -= window.popleft()
 
 
 def vol_rel(current_volume: int | float, baseline_avg: float) -> float:
@@ -64,6 +100,20 @@ def classify_volume(vol_rel_value: float, config: VPAConfig) -> VolumeState:
     return VolumeState.AVERAGE
 
 
+def classify_volume_batch(vol_rel_values: list[float], config: VPAConfig) -> list[VolumeState]:
+    """Vectorized ``classify_volume``: one VolumeState per value, same precedence.
+
+    Thresholds are read once for the whole column.
+    """
+    t = config.vol.thresholds
+    ultra_gt, high_gt, low_lt = t.ultra_high_gt, t.high_gt, t.low_lt
+    ultra, high, low, avg = VolumeState.ULTRA_HIGH, VolumeState.HIGH, VolumeState.LOW, VolumeState.AVERAGE
+    return [
+        ultra if x > ultra_gt else high if x > high_gt else low if x < low_lt else avg
+        for x in vol_rel_values
+    ]
+
+
 # ---------------------------------------------------------------------------
 # Legacy 3-state classifier (DEPRECATED — kept for backward compat)
 # ---------------------------------------------------------------------------
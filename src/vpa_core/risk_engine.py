@@ -13,7 +13,6 @@ Responsibilities:
 
 from __future__ import annotations
 
-import math
 from dataclasses import dataclass
 
 from config.vpa_config import VPAConfig
@@ -27,8 +26,13 @@ from vpa_core.contracts import (
 )
 from vpa_core.setup_composer import SetupMatch
 
+# Reject reasons; the templates are only formatted on the reject path.
+_MAX_POSITIONS_REASON = "Max concurrent positions ({}) reached"
+_DAILY_LOSS_REASON = "Daily loss limit ({:.1%}) reached"
+_ZERO_SIZE_REASON = "Computed size is zero (stop too close or equity too low)"
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class AccountState:
     """Current account snapshot for risk calculations."""
     equity: float
@@ -109,7 +113,10 @@ def _compute_size(
     if risk_per_share <= 0:
         return 0
     raw_size = (equity * risk_pct) / risk_per_share
-    return max(1, math.floor(raw_size))
+    # int() truncates toward zero, which equals floor() wherever the result
+    # can exceed the 1-share minimum.
+    size = int(raw_size)
+    return size if size > 1 else 1
 
 
 def evaluate_risk(
@@ -143,24 +150,28 @@ def evaluate_risk(
     TradeIntent
         Status READY (approved) or REJECTED (with reason).
     """
+    # Rejected intents carry the same id and rationale, so both are built up front.
     intent_id = f"TI-{match.setup_id}-bar{match.matched_at_bar}"
-    rationale = [sig.id for sig in match.signals]
+    rationale = list(match.signal_ids)
+    risk = config.risk
 
     # --- Hard rejects ---
 
-    if account.open_position_count >= config.risk.max_concurrent_positions:
+    max_positions = risk.max_concurrent_positions
+    if account.open_position_count >= max_positions:
         return _reject(
             intent_id, match, config,
-            reason=f"Max concurrent positions ({config.risk.max_concurrent_positions}) reached",
+            reason=_MAX_POSITIONS_REASON.format(max_positions),
             rationale=rationale,
         )
 
-    if config.risk.daily_loss_limit_pct is not None:
-        daily_loss_limit = account.equity * config.risk.daily_loss_limit_pct
+    loss_limit_pct = risk.daily_loss_limit_pct
+    if loss_limit_pct is not None:
+        daily_loss_limit = account.equity * loss_limit_pct
         if account.daily_realized_pnl <= -daily_loss_limit:
             return _reject(
                 intent_id, match, config,
-                reason=f"Daily loss limit ({config.risk.daily_loss_limit_pct:.1%}) reached",
+                reason=_DAILY_LOSS_REASON.format(loss_limit_pct),
                 rationale=rationale,
             )
 
@@ -168,12 +179,13 @@ def evaluate_risk(
 
     stop, stop_method = _compute_stop(match, current_price, config, atr_value)
     if stop_method == "ATR":
-        rationale.append(f"stop:ATR({config.atr.period})x{config.atr.stop_multiplier}")
-    risk_pct = config.risk.risk_pct_per_trade
+        atr = config.atr
+        rationale.append(f"stop:ATR({atr.period})x{atr.stop_multiplier}")
+    risk_pct = risk.risk_pct_per_trade
 
     if config.gates.ctx2_dominant_alignment_policy == "REDUCE_RISK":
         if context.dominant_alignment == DominantAlignment.AGAINST:
-            risk_pct *= config.risk.countertrend_multiplier
+            risk_pct *= risk.countertrend_multiplier
             rationale.append("CTX-2:AGAINST(risk_reduced)")
         elif context.dominant_alignment == DominantAlignment.WITH:
             rationale.append("CTX-2:WITH")
@@ -183,7 +195,7 @@ def evaluate_risk(
     if size <= 0:
         return _reject(
             intent_id, match, config,
-            reason="Computed size is zero (stop too close or equity too low)",
+            reason=_ZERO_SIZE_REASON,
             rationale=rationale,
         )
 
@@ -30,7 +30,9 @@ Canonical rules implemented:
 
 from __future__ import annotations
 
+from collections.abc import Callable, Sequence
 from datetime import datetime, timezone
+from itertools import product
 from typing import TYPE_CHECKING
 
 from vpa_core.contracts import (
@@ -50,6 +52,44 @@ from vpa_core.contracts import (
 if TYPE_CHECKING:
     from config.vpa_config import VPAConfig
 
+# Enum members and state sets used by the detectors, bound once at import:
+# resolving ``VolumeState.HIGH`` goes through the enum metaclass on every
+# access, and a literal tuple of members is rebuilt on every call.
+_UP = CandleType.UP
+_NARROW = SpreadState.NARROW
+_WIDE = SpreadState.WIDE
+_LOW = VolumeState.LOW
+
+_HIGH_VOL = frozenset({VolumeState.HIGH, VolumeState.ULTRA_HIGH})
+_LOW_VOL = frozenset({_LOW})
+_ACTIVE_VOL = frozenset({VolumeState.AVERAGE, VolumeState.HIGH, VolumeState.ULTRA_HIGH})
+_UP_ONLY = frozenset({_UP})
+_QUIET_SPREAD = frozenset({_NARROW, SpreadState.NORMAL})
+_ACTIVE_SPREAD = frozenset({SpreadState.NORMAL, _WIDE})
+
+# Serialized value of each state member for evidence dicts; Enum.value is a
+# Python-level property, a dict hit is several times cheaper.
+_STATE_VALUE = {
+    member: member.value for states in (CandleType, SpreadState, VolumeState) for member in states
+}
+
+
+def _state_evidence(features: CandleFeatures, **extra: object) -> dict:
+    """Evidence shared by the state-only rules: both states and relative levels.
+
+    Pipeline stages add keys to ``evidence`` later, so each call returns a
+    fresh dict.
+    """
+    evidence = {
+        "spread_state": _STATE_VALUE[features.spread_state],
+        "vol_state": _STATE_VALUE[features.vol_state],
+        "vol_rel": features.vol_rel,
+        "spread_rel": features.spread_rel,
+    }
+    if extra:
+        evidence.update(extra)
+    return evidence
+
 
 # ---------------------------------------------------------------------------
 # VAL-1 — Single-bar validation (bullish drive)
@@ -57,6 +97,21 @@ if TYPE_CHECKING:
 # ---------------------------------------------------------------------------
 
 
+def _val_1_event(features: CandleFeatures, config: VPAConfig) -> SignalEvent:
+    """Build the VAL-1 event for a bar already known to meet its state conditions."""
+    return SignalEvent(
+        id="VAL-1",
+        name="SingleBarValidation_BullishDrive",
+        tf=features.tf,
+        ts=features.ts,
+        signal_class=SignalClass.VALIDATION,
+        direction_bias="BULLISH",
+        priority=1,
+        evidence=_state_evidence(features),
+        requires_context_gate=False,
+    )
+
+
 def detect_val_1(features: CandleFeatures, config: VPAConfig) -> SignalEvent | None:
     """Detect VAL-1: wide up bar on high/ultra-high volume = validated bullish drive.
 
@@ -67,37 +122,37 @@ def detect_val_1(features: CandleFeatures, config: VPAConfig) -> SignalEvent | N
 
     No context gate required for validation signals.
     """
-    if features.candle_type != CandleType.UP:
+    if features.candle_type != _UP:
         return None
-    if features.spread_state != SpreadState.WIDE:
+    if features.spread_state != _WIDE:
         return None
-    if features.vol_state not in (VolumeState.HIGH, VolumeState.ULTRA_HIGH):
+    if features.vol_state not in _HIGH_VOL:
         return None
 
+    return _val_1_event(features, config)
+
+
+# ---------------------------------------------------------------------------
+# VAL-2 — Single-bar validation (small progress)
+# Registry: close > open, spreadState == NARROW, volState == LOW
+# ---------------------------------------------------------------------------
+
+
+def _val_2_event(features: CandleFeatures, config: VPAConfig) -> SignalEvent:
+    """Build the VAL-2 event for a bar already known to meet its state conditions."""
     return SignalEvent(
-        id="VAL-1",
-        name="SingleBarValidation_BullishDrive",
+        id="VAL-2",
+        name="SingleBarValidation_SmallProgress",
         tf=features.tf,
         ts=features.ts,
         signal_class=SignalClass.VALIDATION,
         direction_bias="BULLISH",
         priority=1,
-        evidence={
-            "spread_state": features.spread_state.value,
-            "vol_state": features.vol_state.value,
-            "vol_rel": features.vol_rel,
-            "spread_rel": features.spread_rel,
-        },
+        evidence=_state_evidence(features),
         requires_context_gate=False,
     )
 
 
-# ---------------------------------------------------------------------------
-# VAL-2 — Single-bar validation (small progress)
-# Registry: close > open, spreadState == NARROW, volState == LOW
-# ---------------------------------------------------------------------------
-
-
 def detect_val_2(features: CandleFeatures, config: VPAConfig) -> SignalEvent | None:
     """Detect VAL-2: narrow up bar on low volume = validated small progress.
 
@@ -111,29 +166,14 @@ def detect_val_2(features: CandleFeatures, config: VPAConfig) -> SignalEvent | N
 
     No context gate required for validation signals.
     """
-    if features.candle_type != CandleType.UP:
+    if features.candle_type != _UP:
         return None
-    if features.spread_state != SpreadState.NARROW:
+    if features.spread_state != _NARROW:
         return None
-    if features.vol_state != VolumeState.LOW:
+    if features.vol_state != _LOW:
         return None
 
-    return SignalEvent(
-        id="VAL-2",
-        name="SingleBarValidation_SmallProgress",
-        tf=features.tf,
-        ts=features.ts,
-        signal_class=SignalClass.VALIDATION,
-        direction_bias="BULLISH",
-        priority=1,
-        evidence={
-            "spread_state": features.spread_state.value,
-            "vol_state": features.vol_state.value,
-            "vol_rel": features.vol_rel,
-            "spread_rel": features.spread_rel,
-        },
-        requires_context_gate=False,
-    )
+    return _val_2_event(features, config)
 
 
 # ---------------------------------------------------------------------------
@@ -142,6 +182,21 @@ def detect_val_2(features: CandleFeatures, config: VPAConfig) -> SignalEvent | N
 # ---------------------------------------------------------------------------
 
 
+def _anom_1_event(features: CandleFeatures, config: VPAConfig) -> SignalEvent:
+    """Build the ANOM-1 event for a bar already known to meet its state conditions."""
+    return SignalEvent(
+        id="ANOM-1",
+        name="BigResultLittleEffort_TrapUpWarning",
+        tf=features.tf,
+        ts=features.ts,
+        signal_class=SignalClass.ANOMALY,
+        direction_bias="BEARISH_OR_WAIT",
+        priority=2,
+        evidence=_state_evidence(features),
+        requires_context_gate=True,
+    )
+
+
 def detect_anom_1(features: CandleFeatures, config: VPAConfig) -> SignalEvent | None:
     """Detect ANOM-1: wide up bar on low volume = anomaly / trap-up warning.
 
@@ -152,29 +207,14 @@ def detect_anom_1(features: CandleFeatures, config: VPAConfig) -> SignalEvent |
 
     Requires CTX-1 gate (trend location must be known before acting).
     """
-    if features.candle_type != CandleType.UP:
+    if features.candle_type != _UP:
         return None
-    if features.spread_state != SpreadState.WIDE:
+    if features.spread_state != _WIDE:
         return None
-    if features.vol_state != VolumeState.LOW:
+    if features.vol_state != _LOW:
         return None
 
-    return SignalEvent(
-        id="ANOM-1",
-        name="BigResultLittleEffort_TrapUpWarning",
-        tf=features.tf,
-        ts=features.ts,
-        signal_class=SignalClass.ANOMALY,
-        direction_bias="BEARISH_OR_WAIT",
-        priority=2,
-        evidence={
-            "spread_state": features.spread_state.value,
-            "vol_state": features.vol_state.value,
-            "vol_rel": features.vol_rel,
-            "spread_rel": features.spread_rel,
-        },
-        requires_context_gate=True,
-    )
+    return _anom_1_event(features, config)
 
 
 # ---------------------------------------------------------------------------
@@ -201,13 +241,12 @@ def detect_str_1(features: CandleFeatures, config: VPAConfig) -> SignalEvent | N
 
     h = config.candle_patterns.hammer
     lower_ratio = features.lower_wick / rng
-    body_ratio = features.spread / rng
-    upper_ratio = features.upper_wick / rng
-
     if lower_ratio < h.lower_wick_ratio_min:
         return None
+    body_ratio = features.spread / rng
     if body_ratio > h.body_ratio_max:
         return None
+    upper_ratio = features.upper_wick / rng
     if upper_ratio > h.upper_wick_ratio_max:
         return None
 
@@ -223,8 +262,8 @@ def detect_str_1(features: CandleFeatures, config: VPAConfig) -> SignalEvent | N
             "lower_wick_ratio": round(lower_ratio, 4),
             "body_ratio": round(body_ratio, 4),
             "upper_wick_ratio": round(upper_ratio, 4),
-            "vol_state": features.vol_state.value,
-            "spread_state": features.spread_state.value,
+            "vol_state": _STATE_VALUE[features.vol_state],
+            "spread_state": _STATE_VALUE[features.spread_state],
         },
         requires_context_gate=True,
     )
@@ -255,13 +294,12 @@ def detect_weak_1(features: CandleFeatures, config: VPAConfig) -> SignalEvent |
 
     ss = config.candle_patterns.shooting_star
     upper_ratio = features.upper_wick / rng
-    body_ratio = features.spread / rng
-    lower_ratio = features.lower_wick / rng
-
     if upper_ratio < ss.upper_wick_ratio_min:
         return None
+    body_ratio = features.spread / rng
     if body_ratio > ss.body_ratio_max:
         return None
+    lower_ratio = features.lower_wick / rng
     if lower_ratio > ss.lower_wick_ratio_max:
         return None
 
@@ -277,8 +315,8 @@ def detect_weak_1(features: CandleFeatures, config: VPAConfig) -> SignalEvent |
             "upper_wick_ratio": round(upper_ratio, 4),
             "body_ratio": round(body_ratio, 4),
             "lower_wick_ratio": round(lower_ratio, 4),
-            "vol_state": features.vol_state.value,
-            "spread_state": features.spread_state.value,
+            "vol_state": _STATE_VALUE[features.vol_state],
+            "spread_state": _STATE_VALUE[features.spread_state],
         },
         requires_context_gate=True,
     )
@@ -307,18 +345,17 @@ def detect_weak_2(features: CandleFeatures, config: VPAConfig) -> SignalEvent |
     if rng <= 0:
         return None
 
-    if features.vol_state != VolumeState.LOW:
+    if features.vol_state != _LOW:
         return None
 
     ss = config.candle_patterns.shooting_star
     upper_ratio = features.upper_wick / rng
-    body_ratio = features.spread / rng
-    lower_ratio = features.lower_wick / rng
-
     if upper_ratio < ss.upper_wick_ratio_min:
         return None
+    body_ratio = features.spread / rng
     if body_ratio > ss.body_ratio_max:
         return None
+    lower_ratio = features.lower_wick / rng
     if lower_ratio > ss.lower_wick_ratio_max:
         return None
 
@@ -334,7 +371,7 @@ def detect_weak_2(features: CandleFeatures, config: VPAConfig) -> SignalEvent |
             "upper_wick_ratio": round(upper_ratio, 4),
             "body_ratio": round(body_ratio, 4),
             "lower_wick_ratio": round(lower_ratio, 4),
-            "vol_state": features.vol_state.value,
+            "vol_state": _STATE_VALUE[features.vol_state],
             "vol_rel": features.vol_rel,
         },
         requires_context_gate=True,
@@ -369,18 +406,17 @@ def detect_climax_sell_1(features: CandleFeatures, config: VPAConfig) -> SignalE
     if rng <= 0:
         return None
 
-    if features.vol_state not in (VolumeState.HIGH, VolumeState.ULTRA_HIGH):
+    if features.vol_state not in _HIGH_VOL:
         return None
 
     ss = config.candle_patterns.shooting_star
     upper_ratio = features.upper_wick / rng
-    body_ratio = features.spread / rng
-    lower_ratio = features.lower_wick / rng
-
     if upper_ratio < ss.upper_wick_ratio_min:
         return None
+    body_ratio = features.spread / rng
     if body_ratio > ss.body_ratio_max:
         return None
+    lower_ratio = features.lower_wick / rng
     if lower_ratio > ss.lower_wick_ratio_max:
         return None
 
@@ -396,7 +432,7 @@ def detect_climax_sell_1(features: CandleFeatures, config: VPAConfig) -> SignalE
             "upper_wick_ratio": round(upper_ratio, 4),
             "body_ratio": round(body_ratio, 4),
             "lower_wick_ratio": round(lower_ratio, 4),
-            "vol_state": features.vol_state.value,
+            "vol_state": _STATE_VALUE[features.vol_state],
             "vol_rel": features.vol_rel,
         },
         requires_context_gate=True,
@@ -431,7 +467,7 @@ def detect_climax_sell_2(features: CandleFeatures, config: VPAConfig) -> SignalE
     if rng <= 0:
         return None
 
-    if features.vol_state not in (VolumeState.HIGH, VolumeState.ULTRA_HIGH):
+    if features.vol_state not in _HIGH_VOL:
         return None
 
     ss = config.candle_patterns.shooting_star
@@ -458,7 +494,7 @@ def detect_climax_sell_2(features: CandleFeatures, config: VPAConfig) -> SignalE
             "upper_wick_ratio": round(upper_ratio, 4),
             "body_ratio": round(body_ratio, 4),
             "lower_wick_ratio": round(lower_ratio, 4),
-            "vol_state": features.vol_state.value,
+            "vol_state": _STATE_VALUE[features.vol_state],
             "vol_rel": features.vol_rel,
         },
         requires_context_gate=True,
@@ -471,6 +507,21 @@ def detect_climax_sell_2(features: CandleFeatures, config: VPAConfig) -> SignalE
 # ---------------------------------------------------------------------------
 
 
+def _anom_2_event(features: CandleFeatures, config: VPAConfig) -> SignalEvent:
+    """Build the ANOM-2 event for a bar already known to meet its state conditions."""
+    return SignalEvent(
+        id="ANOM-2",
+        name="BigEffortLittleResult_Absorption",
+        tf=features.tf,
+        ts=features.ts,
+        signal_class=SignalClass.ANOMALY,
+        direction_bias="BEARISH_OR_WAIT",
+        priority=2,
+        evidence=_state_evidence(features, candle_type=_STATE_VALUE[features.candle_type]),
+        requires_context_gate=True,
+    )
+
+
 def detect_anom_2(features: CandleFeatures, config: VPAConfig) -> SignalEvent | None:
     """Detect ANOM-2: high volume but narrow/normal spread = absorption/weakness.
 
@@ -484,36 +535,41 @@ def detect_anom_2(features: CandleFeatures, config: VPAConfig) -> SignalEvent |
 
     Requires CTX-1 gate (trend location must be known).
     """
-    if features.vol_state not in (VolumeState.HIGH, VolumeState.ULTRA_HIGH):
+    if features.vol_state not in _HIGH_VOL:
         return None
-    if features.spread_state not in (SpreadState.NARROW, SpreadState.NORMAL):
+    if features.spread_state not in _QUIET_SPREAD:
         return None
 
+    return _anom_2_event(features, config)
+
+
+# ---------------------------------------------------------------------------
+# CONF-1 — Positive response bar (confirmation candle)
+# Registry: candle_type == UP, volState >= AVERAGE, spreadState >= NORMAL
+# ---------------------------------------------------------------------------
+
+
+def _conf_1_event(features: CandleFeatures, config: VPAConfig) -> SignalEvent:
+    """Build the CONF-1 event for a bar already known to meet its state conditions."""
     return SignalEvent(
-        id="ANOM-2",
-        name="BigEffortLittleResult_Absorption",
+        id="CONF-1",
+        name="PositiveResponse_Confirmation",
         tf=features.tf,
         ts=features.ts,
-        signal_class=SignalClass.ANOMALY,
-        direction_bias="BEARISH_OR_WAIT",
-        priority=2,
+        signal_class=SignalClass.CONFIRMATION,
+        direction_bias="BULLISH",
+        priority=3,
         evidence={
-            "spread_state": features.spread_state.value,
-            "vol_state": features.vol_state.value,
+            "candle_type": _STATE_VALUE[features.candle_type],
+            "spread_state": _STATE_VALUE[features.spread_state],
+            "vol_state": _STATE_VALUE[features.vol_state],
             "vol_rel": features.vol_rel,
             "spread_rel": features.spread_rel,
-            "candle_type": features.candle_type.value,
         },
-        requires_context_gate=True,
+        requires_context_gate=False,
     )
 
 
-# ---------------------------------------------------------------------------
-# CONF-1 — Positive response bar (confirmation candle)
-# Registry: candle_type == UP, volState >= AVERAGE, spreadState >= NORMAL
-# ---------------------------------------------------------------------------
-
-
 def detect_conf_1(features: CandleFeatures, config: VPAConfig) -> SignalEvent | None:
     """Detect CONF-1: positive response bar — bullish confirmation candle.
 
@@ -531,30 +587,14 @@ def detect_conf_1(features: CandleFeatures, config: VPAConfig) -> SignalEvent |
 
     No context gate required (the prior signal's gate is sufficient).
     """
-    if features.candle_type != CandleType.UP:
+    if features.candle_type != _UP:
         return None
-    if features.vol_state not in (VolumeState.AVERAGE, VolumeState.HIGH, VolumeState.ULTRA_HIGH):
+    if features.vol_state not in _ACTIVE_VOL:
         return None
-    if features.spread_state not in (SpreadState.NORMAL, SpreadState.WIDE):
+    if features.spread_state not in _ACTIVE_SPREAD:
         return None
 
-    return SignalEvent(
-        id="CONF-1",
-        name="PositiveResponse_Confirmation",
-        tf=features.tf,
-        ts=features.ts,
-        signal_class=SignalClass.CONFIRMATION,
-        direction_bias="BULLISH",
-        priority=3,
-        evidence={
-            "candle_type": features.candle_type.value,
-            "spread_state": features.spread_state.value,
-            "vol_state": features.vol_state.value,
-            "vol_rel": features.vol_rel,
-            "spread_rel": features.spread_rel,
-        },
-        requires_context_gate=False,
-    )
+    return _conf_1_event(features, config)
 
 
 # ---------------------------------------------------------------------------
@@ -582,18 +622,17 @@ def detect_avoid_news_1(features: CandleFeatures, config: VPAConfig) -> SignalEv
     if rng <= 0:
         return None
 
-    if features.vol_state != VolumeState.LOW:
+    if features.vol_state != _LOW:
         return None
 
     doji = config.candle_patterns.long_legged_doji
     body_ratio = features.spread / rng
-    upper_ratio = features.upper_wick / rng
-    lower_ratio = features.lower_wick / rng
-
     if body_ratio > doji.body_ratio_max:
         return None
+    upper_ratio = features.upper_wick / rng
     if upper_ratio < doji.min_wick_ratio:
         return None
+    lower_ratio = features.lower_wick / rng
     if lower_ratio < doji.min_wick_ratio:
         return None
 
@@ -609,7 +648,7 @@ def detect_avoid_news_1(features: CandleFeatures, config: VPAConfig) -> SignalEv
             "body_ratio": round(body_ratio, 4),
             "upper_wick_ratio": round(upper_ratio, 4),
             "lower_wick_ratio": round(lower_ratio, 4),
-            "vol_state": features.vol_state.value,
+            "vol_state": _STATE_VALUE[features.vol_state],
         },
         requires_context_gate=False,
     )
@@ -621,6 +660,21 @@ def detect_avoid_news_1(features: CandleFeatures, config: VPAConfig) -> SignalEv
 # ---------------------------------------------------------------------------
 
 
+def _test_sup_1_event(features: CandleFeatures, config: VPAConfig) -> SignalEvent:
+    """Build the TEST-SUP-1 event for a bar already known to meet its state conditions."""
+    return SignalEvent(
+        id="TEST-SUP-1",
+        name="TestOfSupply_SellingPressureRemoved",
+        tf=features.tf,
+        ts=features.ts,
+        signal_class=SignalClass.TEST,
+        direction_bias="BULLISH",
+        priority=1,
+        evidence=_state_evidence(features),
+        requires_context_gate=True,
+    )
+
+
 def detect_test_sup_1(features: CandleFeatures, config: VPAConfig) -> SignalEvent | None:
     """Detect TEST-SUP-1: quiet, low-volume bar = supply test pass.
 
@@ -634,35 +688,35 @@ def detect_test_sup_1(features: CandleFeatures, config: VPAConfig) -> SignalEven
     Requires CTX-1 gate (congestion/trend context must be known).
     Evidence includes bar_low for stop placement in ENTRY-LONG-1.
     """
-    if features.vol_state != VolumeState.LOW:
+    if features.vol_state != _LOW:
         return None
-    if features.spread_state not in (SpreadState.NARROW, SpreadState.NORMAL):
+    if features.spread_state not in _QUIET_SPREAD:
         return None
 
+    return _test_sup_1_event(features, config)
+
+
+# ---------------------------------------------------------------------------
+# TEST-SUP-2 — Failed test of supply (high volume = supply still present)
+# Canonical: VPA_ACTIONABLE_RULES §6 — TEST-SUP setup bar but HIGH/ULTRA vol
+# ---------------------------------------------------------------------------
+
+
+def _test_sup_2_event(features: CandleFeatures, config: VPAConfig) -> SignalEvent:
+    """Build the TEST-SUP-2 event for a bar already known to meet its state conditions."""
     return SignalEvent(
-        id="TEST-SUP-1",
-        name="TestOfSupply_SellingPressureRemoved",
+        id="TEST-SUP-2",
+        name="FailedTestOfSupply_SupplyStillPresent",
         tf=features.tf,
         ts=features.ts,
         signal_class=SignalClass.TEST,
-        direction_bias="BULLISH",
+        direction_bias="BEARISH_OR_WAIT",
         priority=1,
-        evidence={
-            "spread_state": features.spread_state.value,
-            "vol_state": features.vol_state.value,
-            "vol_rel": features.vol_rel,
-            "spread_rel": features.spread_rel,
-        },
+        evidence=_state_evidence(features),
         requires_context_gate=True,
     )
 
 
-# ---------------------------------------------------------------------------
-# TEST-SUP-2 — Failed test of supply (high volume = supply still present)
-# Canonical: VPA_ACTIONABLE_RULES §6 — TEST-SUP setup bar but HIGH/ULTRA vol
-# ---------------------------------------------------------------------------
-
-
 def detect_test_sup_2(features: CandleFeatures, config: VPAConfig) -> SignalEvent | None:
     """Detect TEST-SUP-2: failed supply test — supply still present.
 
@@ -675,27 +729,12 @@ def detect_test_sup_2(features: CandleFeatures, config: VPAConfig) -> SignalEven
 
     Requires CTX-1 gate (congestion/trend context must be known).
     """
-    if features.vol_state not in (VolumeState.HIGH, VolumeState.ULTRA_HIGH):
+    if features.vol_state not in _HIGH_VOL:
         return None
-    if features.spread_state not in (SpreadState.NARROW, SpreadState.NORMAL):
+    if features.spread_state not in _QUIET_SPREAD:
         return None
 
-    return SignalEvent(
-        id="TEST-SUP-2",
-        name="FailedTestOfSupply_SupplyStillPresent",
-        tf=features.tf,
-        ts=features.ts,
-        signal_class=SignalClass.TEST,
-        direction_bias="BEARISH_OR_WAIT",
-        priority=1,
-        evidence={
-            "spread_state": features.spread_state.value,
-            "vol_state": features.vol_state.value,
-            "vol_rel": features.vol_rel,
-            "spread_rel": features.spread_rel,
-        },
-        requires_context_gate=True,
-    )
+    return _test_sup_2_event(features, config)
 
 
 # ---------------------------------------------------------------------------
@@ -724,7 +763,7 @@ def detect_test_dem_1(features: CandleFeatures, config: VPAConfig) -> SignalEven
     if rng <= 0:
         return None
 
-    if features.vol_state != VolumeState.LOW:
+    if features.vol_state != _LOW:
         return None
 
     body_ratio = features.spread / rng
@@ -746,7 +785,7 @@ def detect_test_dem_1(features: CandleFeatures, config: VPAConfig) -> SignalEven
             "body_ratio": round(body_ratio, 4),
             "upper_wick": features.upper_wick,
             "lower_wick": features.lower_wick,
-            "vol_state": features.vol_state.value,
+            "vol_state": _STATE_VALUE[features.vol_state],
             "vol_rel": features.vol_rel,
         },
         requires_context_gate=True,
@@ -775,22 +814,208 @@ _RULE_DETECTORS = [
 ]
 
 
+# Necessary (not sufficient) state conditions per detector, as
+# (candle_types, spread_states, vol_states); None means unconstrained.
+# Each detector still checks its full conditions, so these only rule out
+# detectors that cannot fire for a bar's state triple.
+_STATE_PRECONDITIONS = {
+    detect_val_1: (_UP_ONLY, frozenset({_WIDE}), _HIGH_VOL),
+    detect_val_2: (_UP_ONLY, frozenset({_NARROW}), _LOW_VOL),
+    detect_anom_1: (_UP_ONLY, frozenset({_WIDE}), _LOW_VOL),
+    detect_anom_2: (None, _QUIET_SPREAD, _HIGH_VOL),
+    detect_str_1: (None, None, None),
+    detect_weak_1: (None, None, None),
+    detect_weak_2: (None, None, _LOW_VOL),
+    detect_climax_sell_1: (None, None, _HIGH_VOL),
+    detect_climax_sell_2: (None, None, _HIGH_VOL),
+    detect_conf_1: (_UP_ONLY, _ACTIVE_SPREAD, _ACTIVE_VOL),
+    detect_avoid_news_1: (None, None, _LOW_VOL),
+    detect_test_sup_1: (None, _QUIET_SPREAD, _LOW_VOL),
+    detect_test_sup_2: (None, _QUIET_SPREAD, _HIGH_VOL),
+    detect_test_dem_1: (None, None, _LOW_VOL),
+}
+
+
+def _detectors_for_states(
+    candle_type: CandleType,
+    spread_state: SpreadState,
+    vol_state: VolumeState,
+) -> tuple[Callable[..., SignalEvent | None], ...]:
+    """Detectors (in registry order) whose state preconditions admit this triple."""
+    return tuple(
+        detector
+        for detector in _RULE_DETECTORS
+        if all(
+            allowed is None or state in allowed
+            for allowed, state in zip(
+                _STATE_PRECONDITIONS[detector], (candle_type, spread_state, vol_state)
+            )
+        )
+    )
+
+
+# Rules decided by the state triple alone: their preconditions above are
+# the complete rule, so an admitted bar always fires and the table can call
+# the event builder without re-testing the states.
+_STATE_ONLY_BUILDERS = {
+    detect_val_1: _val_1_event,
+    detect_val_2: _val_2_event,
+    detect_anom_1: _anom_1_event,
+    detect_anom_2: _anom_2_event,
+    detect_conf_1: _conf_1_event,
+    detect_test_sup_1: _test_sup_1_event,
+    detect_test_sup_2: _test_sup_2_event,
+}
+
+# Every (candle_type, spread_state, vol_state) triple resolved up front, so
+# per-bar evaluation is one dict lookup instead of re-testing preconditions.
+_DETECTORS_BY_STATES = {
+    states: tuple(
+        _STATE_ONLY_BUILDERS.get(detector, detector)
+        for detector in _detectors_for_states(*states)
+    )
+    for states in product(CandleType, SpreadState, VolumeState)
+}
+
+
 def evaluate_rules(
     features: CandleFeatures,
     config: VPAConfig,
 ) -> list[SignalEvent]:
     """Run all registered bar-level rule detectors and return any emitted signals.
 
+    Only detectors whose state preconditions admit the bar's state triple
+    are called (see ``_STATE_PRECONDITIONS``), and state-only rules go
+    straight to their event builder. A triple outside the canonical enums
+    falls back to the full registry.
+
     Returns an empty list if no rules fire (the common case).
     """
+    detectors = _DETECTORS_BY_STATES.get(
+        (features.candle_type, features.spread_state, features.vol_state), _RULE_DETECTORS
+    )
     signals: list[SignalEvent] = []
-    for detector in _RULE_DETECTORS:
+    for detector in detectors:
         result = detector(features, config)
         if result is not None:
             signals.append(result)
     return signals
 
 
+# Candle-geometry bits from _wick_pattern_codes: each is set when a bar passes
+# one detector family's range and wick-ratio gates.
+_HAMMER = 1  # STR-1
+_STAR = 2  # WEAK-1, WEAK-2, CLIMAX-SELL-1
+_UPPER_WICK = 4  # CLIMAX-SELL-2
+_DOJI = 8  # AVOID-NEWS-1
+_NO_DEMAND = 16  # TEST-DEM-1
+
+
+def _wick_pattern_codes(features: Sequence[CandleFeatures], config: VPAConfig) -> list[int]:
+    """Geometry bits per bar, with each bar's three ratios computed once.
+
+    Each bit reproduces its detectors' gates (same divisions, same
+    comparisons), so a cleared bit means those detectors return None.
+    """
+    cp = config.candle_patterns
+    h, ss, doji = cp.hammer, cp.shooting_star, cp.long_legged_doji
+    h_lower, h_body, h_upper = h.lower_wick_ratio_min, h.body_ratio_max, h.upper_wick_ratio_max
+    ss_upper, ss_body, ss_lower = ss.upper_wick_ratio_min, ss.body_ratio_max, ss.lower_wick_ratio_max
+    doji_body, doji_wick = doji.body_ratio_max, doji.min_wick_ratio
+
+    codes: list[int] = []
+    append = codes.append
+    for f in features:
+        rng = f.range
+        if rng <= 0:
+            append(0)
+            continue
+        lower_ratio = f.lower_wick / rng
+        body_ratio = f.spread / rng
+        upper_ratio = f.upper_wick / rng
+        code = 0
+        if not (lower_ratio < h_lower or body_ratio > h_body or upper_ratio > h_upper):
+            code |= _HAMMER
+        if not upper_ratio < ss_upper:
+            if not (body_ratio > ss_body or lower_ratio > ss_lower):
+                code |= _STAR
+            if not (body_ratio <= ss_body and lower_ratio <= ss_lower):
+                code |= _UPPER_WICK
+        if not (body_ratio > doji_body or upper_ratio < doji_wick or lower_ratio < doji_wick):
+            code |= _DOJI
+        if not (body_ratio > ss_body or f.upper_wick <= f.lower_wick):
+            code |= _NO_DEMAND
+        append(code)
+    return codes
+
+
+def wick_pattern_masks(
+    features: Sequence[CandleFeatures],
+    config: VPAConfig,
+) -> tuple[list[bool], list[bool]]:
+    """Hammer and shooting-star geometry for a feature series, one flag per bar.
+
+    ``hammer[i]`` is True exactly when ``features[i]`` passes STR-1's range
+    and wick-ratio gates; ``star[i]`` likewise for the shooting-star gates
+    shared by WEAK-1, WEAK-2 and CLIMAX-SELL-1. The ratios are computed
+    with the same divisions as the detectors, so boundary bars agree.
+    """
+    codes = _wick_pattern_codes(features, config)
+    return [bool(c & _HAMMER) for c in codes], [bool(c & _STAR) for c in codes]
+
+
+# Geometry bit each shape detector needs; the batch path drops a detector
+# for bars whose _wick_pattern_codes entry lacks its bit.
+_WICK_GATE = {
+    detect_str_1: _HAMMER,
+    detect_weak_1: _STAR,
+    detect_weak_2: _STAR,
+    detect_climax_sell_1: _STAR,
+    detect_climax_sell_2: _UPPER_WICK,
+    detect_avoid_news_1: _DOJI,
+    detect_test_dem_1: _NO_DEMAND,
+}
+
+
+def evaluate_rules_batch(
+    features: Sequence[CandleFeatures],
+    config: VPAConfig,
+) -> list[list[SignalEvent]]:
+    """``evaluate_rules`` for a whole feature series.
+
+    Element ``i`` equals ``evaluate_rules(features[i], config)``. Bars are
+    grouped by their (candle_type, spread_state, vol_state) triple first,
+    and each group only runs the detectors whose state preconditions admit
+    that triple, so state-driven rules are never called on bars they
+    cannot fire for. Shape detectors are further skipped on bars whose
+    candle geometry (wick and body ratios, computed once per bar) rules
+    them out.
+    """
+    groups: dict[tuple, list[int]] = {}
+    for i, f in enumerate(features):
+        groups.setdefault((f.candle_type, f.spread_state, f.vol_state), []).append(i)
+    codes = _wick_pattern_codes(features, config)
+
+    out: list[list[SignalEvent]] = [[] for _ in features]
+    for states, indices in groups.items():
+        detectors = _DETECTORS_BY_STATES.get(states, _RULE_DETECTORS)
+        by_code: dict[int, tuple] = {}
+        for i in indices:
+            code = codes[i]
+            runnable = by_code.get(code)
+            if runnable is None:
+                runnable = by_code[code] = tuple(
+                    d for d in detectors if d not in _WICK_GATE or code & _WICK_GATE[d]
+                )
+            f = features[i]
+            signals = out[i]
+            for detector in runnable:
+                result = detector(f, config)
+                if result is not None:
+                    signals.append(result)
+    return out
+
+
 # ---------------------------------------------------------------------------
 # Trend-level rules (multi-bar, context-driven)
 # ---------------------------------------------------------------------------
@@ -802,7 +1027,12 @@ def evaluate_rules(
 # ---------------------------------------------------------------------------
 
 
-def detect_trend_val_1(context: ContextSnapshot, config: VPAConfig) -> SignalEvent | None:
+def detect_trend_val_1(
+    context: ContextSnapshot,
+    config: VPAConfig,
+    *,
+    now: datetime | None = None,
+) -> SignalEvent | None:
     """Detect TREND-VAL-1: price trend UP with volume RISING = validated uptrend.
 
     Conditions (from VPA_ACTIONABLE_RULES §4):
@@ -821,7 +1051,7 @@ def detect_trend_val_1(context: ContextSnapshot, config: VPAConfig) -> SignalEve
         id="TREND-VAL-1",
         name="UptrendValidation_RisingPriceRisingVolume",
         tf=context.tf,
-        ts=_now(),
+        ts=now if now is not None else _now(),
         signal_class=SignalClass.VALIDATION,
         direction_bias="BULLISH",
         priority=2,
@@ -840,7 +1070,12 @@ def detect_trend_val_1(context: ContextSnapshot, config: VPAConfig) -> SignalEve
 # ---------------------------------------------------------------------------
 
 
-def detect_trend_anom_1(context: ContextSnapshot, config: VPAConfig) -> SignalEvent | None:
+def detect_trend_anom_1(
+    context: ContextSnapshot,
+    config: VPAConfig,
+    *,
+    now: datetime | None = None,
+) -> SignalEvent | None:
     """Detect TREND-ANOM-1: price trend UP but volume FALLING = weakening uptrend.
 
     Conditions (from VPA_ACTIONABLE_RULES §4):
@@ -861,7 +1096,7 @@ def detect_trend_anom_1(context: ContextSnapshot, config: VPAConfig) -> SignalEv
         id="TREND-ANOM-1",
         name="UptrendWeakness_RisingPriceFallingVolume",
         tf=context.tf,
-        ts=_now(),
+        ts=now if now is not None else _now(),
         signal_class=SignalClass.ANOMALY,
         direction_bias="BEARISH_OR_WAIT",
         priority=2,
@@ -875,7 +1110,11 @@ def detect_trend_anom_1(context: ContextSnapshot, config: VPAConfig) -> SignalEv
 
 
 def _now() -> datetime:
-    """Return current UTC timestamp for trend-level signals."""
+    """Return current UTC timestamp for trend-level signals.
+
+    Used when the caller passes no ``now``; the clock is only read once a
+    rule has fired.
+    """
     return datetime.now(timezone.utc)
 
 
@@ -893,6 +1132,8 @@ def detect_conf_2(
     bar_signals: list[SignalEvent],
     trend_signals: list[SignalEvent],
     config: VPAConfig,
+    *,
+    now: datetime | None = None,
 ) -> SignalEvent | None:
     """Detect CONF-2: two-level agreement between candle and trend signals.
 
@@ -933,7 +1174,7 @@ def detect_conf_2(
         id="CONF-2",
         name="TwoLevelAgreement_CandleAndTrend",
         tf=bar_signals[0].tf if bar_signals else "",
-        ts=_now(),
+        ts=now if now is not None else _now(),
         signal_class=SignalClass.CONFIRMATION,
         direction_bias=direction,
         priority=1,
@@ -955,6 +1196,8 @@ def detect_conf_2(
 def detect_avoid_trap_1(
     bar_signals: list[SignalEvent],
     config: VPAConfig,
+    *,
+    now: datetime | None = None,
 ) -> SignalEvent | None:
     """Detect AVOID-TRAP-1: ANOM-1 present without same-bar validation.
 
@@ -979,7 +1222,7 @@ def detect_avoid_trap_1(
         id="AVOID-TRAP-1",
         name="TrapUpAnomaly_AvoidLongsUntilConfirmed",
         tf=bar_signals[0].tf if bar_signals else "",
-        ts=_now(),
+        ts=now if now is not None else _now(),
         signal_class=SignalClass.AVOIDANCE,
         direction_bias="NEUTRAL",
         priority=0,
@@ -1000,6 +1243,8 @@ def detect_avoid_trap_1(
 def detect_avoid_counter_1(
     context: ContextSnapshot,
     config: VPAConfig,
+    *,
+    now: datetime | None = None,
 ) -> SignalEvent | None:
     """Detect AVOID-COUNTER-1: dominant alignment is AGAINST.
 
@@ -1019,7 +1264,7 @@ def detect_avoid_counter_1(
         id="AVOID-COUNTER-1",
         name="CounterTrend_ReduceSizeShortHold",
         tf=context.tf,
-        ts=_now(),
+        ts=now if now is not None else _now(),
         signal_class=SignalClass.AVOIDANCE,
         direction_bias="NEUTRAL",
         priority=0,
@@ -1052,32 +1297,38 @@ def _count_anomaly_bars(bars: list[Bar], config: VPAConfig, window: int) -> tupl
 
     count = 0
     positions: list[int] = []
+    if avg_n <= 0:
+        return count, positions
 
-    for offset in range(window, 0, -1):
-        idx = len(bars) - offset
-        bar = bars[idx]
-        lookback = bars[idx - avg_n:idx]
-        if not lookback:
-            continue
-
-        avg_vol = sum(b.volume for b in lookback) / len(lookback)
-        vol_rel = bar.volume / avg_vol if avg_vol > 0 else 0.0
+    # Each window bar's baseline overlaps its neighbours', so read volume and
+    # spread off the tail once and sum column slices per bar.
+    tail = bars[-needed:]
+    volumes = [b.volume for b in tail]
+    spreads = [abs(b.close - b.open) for b in tail]
+    high_gt = config.vol.thresholds.high_gt
+    wide_gt = config.spread.thresholds.wide_gt
 
-        spread = abs(bar.close - bar.open)
-        avg_spread = sum(abs(b.close - b.open) for b in lookback) / len(lookback)
-        spread_rel = spread / avg_spread if avg_spread > 0 else 0.0
+    for j in range(avg_n, needed):
+        avg_vol = sum(volumes[j - avg_n:j]) / avg_n
+        vol_rel = volumes[j] / avg_vol if avg_vol > 0 else 0.0
 
-        is_high_vol = vol_rel > config.vol.thresholds.high_gt
-        is_modest_spread = spread_rel <= config.spread.thresholds.wide_gt
+        avg_spread = sum(spreads[j - avg_n:j]) / avg_n
+        spread_rel = spreads[j] / avg_spread if avg_spread > 0 else 0.0
 
-        if is_high_vol and is_modest_spread:
+        if vol_rel > high_gt and spread_rel <= wide_gt:
             count += 1
-            positions.append(-offset)
+            positions.append(j - needed)
 
     return count, positions
 
 
-def detect_trend_anom_2(bars: list[Bar], config: VPAConfig, tf: str = "15m") -> SignalEvent | None:
+def detect_trend_anom_2(
+    bars: list[Bar],
+    config: VPAConfig,
+    tf: str = "15m",
+    *,
+    now: datetime | None = None,
+) -> SignalEvent | None:
     """Detect TREND-ANOM-2: sequential anomaly cluster in recent bars.
 
     Conditions (from VPA_ACTIONABLE_RULES §4):
@@ -1100,7 +1351,7 @@ def detect_trend_anom_2(bars: list[Bar], config: VPAConfig, tf: str = "15m") ->
         id="TREND-ANOM-2",
         name="SequentialAnomalyCluster_EscalatingWarning",
         tf=tf,
-        ts=_now(),
+        ts=now if now is not None else _now(),
         signal_class=SignalClass.ANOMALY,
         direction_bias="BEARISH_OR_WAIT",
         priority=1,
@@ -1122,16 +1373,19 @@ _TREND_RULE_DETECTORS = [
 def evaluate_trend_rules(
     context: ContextSnapshot,
     config: VPAConfig,
+    *,
+    now: datetime | None = None,
 ) -> list[SignalEvent]:
     """Run all registered trend-level rule detectors.
 
     Trend-level rules operate on the ContextSnapshot (multi-bar analysis)
     rather than single-bar CandleFeatures. They detect patterns like
-    price-volume divergence over the trend window.
+    price-volume divergence over the trend window. Signals are stamped
+    with *now* (current UTC time when omitted).
     """
     signals: list[SignalEvent] = []
     for detector in _TREND_RULE_DETECTORS:
-        result = detector(context, config)
+        result = detector(context, config, now=now)
         if result is not None:
             signals.append(result)
     return signals
@@ -1141,14 +1395,17 @@ def evaluate_cluster_rules(
     bars: list[Bar],
     config: VPAConfig,
     tf: str = "15m",
+    *,
+    now: datetime | None = None,
 ) -> list[SignalEvent]:
     """Run multi-bar cluster rules that need bar history.
 
     These rules count patterns across a window of bars, unlike bar-level
-    rules (single bar) or trend-level rules (context-driven).
+    rules (single bar) or trend-level rules (context-driven). Signals are
+    stamped with *now* (current UTC time when omitted).
     """
     signals: list[SignalEvent] = []
-    result = detect_trend_anom_2(bars, config, tf)
+    result = detect_trend_anom_2(bars, config, tf, now=now)
     if result is not None:
         signals.append(result)
     return signals
@@ -1158,18 +1415,21 @@ def evaluate_avoidance_rules(
     bar_signals: list[SignalEvent],
     context: ContextSnapshot,
     config: VPAConfig,
+    *,
+    now: datetime | None = None,
 ) -> list[SignalEvent]:
     """Run avoidance rules that derive from existing signals and context.
 
     These rules make implicit risk states (trap-ups, counter-trend)
     explicitly visible in the signal chain for journaling and the
-    setup composer's invalidation logic.
+    setup composer's invalidation logic. Signals are stamped with *now*
+    (current UTC time when omitted).
     """
     signals: list[SignalEvent] = []
-    trap = detect_avoid_trap_1(bar_signals, config)
+    trap = detect_avoid_trap_1(bar_signals, config, now=now)
     if trap is not None:
         signals.append(trap)
-    counter = detect_avoid_counter_1(context, config)
+    counter = detect_avoid_counter_1(context, config, now=now)
     if counter is not None:
         signals.append(counter)
     return signals
@@ -32,7 +32,7 @@ class SetupState(str, Enum):
     EXPIRED = "EXPIRED"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CandidateEvent:
     """Lifecycle event for a setup candidate (used by replay/diagnose)."""
     event: Literal["opened", "completed", "expired", "invalidated"]
@@ -44,7 +44,7 @@ class CandidateEvent:
     completer_got: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SetupCandidate:
     """Tracks an in-progress setup sequence."""
     setup_id: str
@@ -55,17 +55,22 @@ class SetupCandidate:
     expires_at_bar: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SetupMatch:
     """A completed setup sequence ready for the risk engine.
 
     No sizing, no stops — just the match result and the evidence chain.
+    ``signal_ids`` is derived from ``signals`` once at construction.
     """
     setup_id: str
     direction: str
     signals: list[SignalEvent]
     matched_at_bar: int
     tf: str
+    signal_ids: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "signal_ids", tuple(sig.id for sig in self.signals))
 
 
 class SetupComposer:
@@ -9,7 +9,7 @@ from datetime import datetime, timezone, timedelta
 import pytest
 
 from config.vpa_config import load_vpa_config, AtrConfig
-from vpa_core.atr import compute_atr, true_range
+from vpa_core.atr import ATRState, compute_atr, compute_atr_batch, true_range
 from vpa_core.contracts import Bar
 
 
@@ -152,6 +152,37 @@ class TestComputeAtr:
         assert atr_default == atr_explicit
 
 
+class TestComputeAtrBatch:
+
+    def test_matches_compute_atr_per_prefix(self) -> None:
+        bars = [
+            _bar(i, high=100.0 + (i * 7) % 5, low=97.0 - (i * 3) % 4, close=98.0 + (i * 5) % 6)
+            for i in range(25)
+        ]
+        batch = compute_atr_batch(bars, period=5)
+        assert batch == [compute_atr(bars[: i + 1], period=5) for i in range(len(bars))]
+
+    def test_empty_bars(self) -> None:
+        assert compute_atr_batch([], period=14) == []
+
+
+class TestATRState:
+
+    def test_update_matches_compute_atr(self) -> None:
+        bars = [
+            _bar(i, high=100.0 + (i * 7) % 5, low=97.0 - (i * 3) % 4, close=98.0 + (i * 5) % 6)
+            for i in range(25)
+        ]
+        state = ATRState(period=5)
+        for i, bar in enumerate(bars):
+            assert state.update(bar) == compute_atr(bars[: i + 1], period=5)
+
+    def test_zero_before_second_bar(self) -> None:
+        state = ATRState()
+        assert state.value == 0.0
+        assert state.update(_bar(0)) == 0.0
+
+
 # ---------------------------------------------------------------------------
 # Config integration
 # ---------------------------------------------------------------------------
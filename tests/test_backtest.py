@@ -3,6 +3,7 @@
 Bar-close evaluation, next-bar-open execution, sizing from Risk Engine.
 """
 
+from dataclasses import replace
 from datetime import datetime, timezone, timedelta
 
 import pytest
@@ -179,6 +180,21 @@ class TestFillPrice:
         assert _fill_price(bar, "SHORT", 0.0) == 105.0
 
 
+# ---------------------------------------------------------------------------
+# Trailing pipeline window
+# ---------------------------------------------------------------------------
+
+
+class TestPipelineWindow:
+    def test_setup_still_found_after_long_history(self, cfg: VPAConfig) -> None:
+        bars = [_bar(i, volume=100_000) for i in range(60)] + [
+            replace(b, timestamp=BASE_TS + timedelta(minutes=15 * (60 + i)))
+            for i, b in enumerate(_short_setup_bars())
+        ]
+        result = run_backtest(bars, "TEST", "15m", config=cfg)
+        assert any(t.setup == "ENTRY-SHORT-1" for t in result.trades)
+
+
 # ---------------------------------------------------------------------------
 # Short-side: ENTRY-SHORT-1 end-to-end
 # ---------------------------------------------------------------------------
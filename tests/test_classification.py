@@ -9,8 +9,8 @@ import pytest
 
 from config.vpa_config import load_vpa_config, VPAConfig
 from vpa_core.contracts import Bar, SpreadState, VolumeState
-from vpa_core.features import average_spread, classify_spread, spread_rel
-from vpa_core.relative_volume import average_volume, classify_volume, vol_rel
+from vpa_core.features import average_spread, average_spread_col, classify_spread, classify_spread_batch, spread_rel
+from vpa_core.relative_volume import average_volume, classify_volume, classify_volume_batch, vol_rel
 
 
 # ---------------------------------------------------------------------------
@@ -177,3 +177,25 @@ class TestAverageSpread:
         ts = datetime.now(timezone.utc)
         bars = [Bar(100.0, 105.0, 99.0, 103.0, 100, ts, "SPY")]
         assert average_spread(bars, lookback=20) == 0.0
+
+    def test_column_variant_matches(self) -> None:
+        bars = [_bar(100.0, 100.0 + 0.7 * k) for k in range(8)]
+        col = [b.spread() for b in bars]
+        for i in range(len(bars)):
+            for lookback in (0, 1, 3, 20):
+                assert average_spread_col(col, i, lookback) == average_spread(bars[: i + 1], lookback)
+
+
+# ---------------------------------------------------------------------------
+# Batch classifiers agree with the scalar ones, boundaries included
+# ---------------------------------------------------------------------------
+
+
+class TestBatchClassifiers:
+    VALUES = [0.0, 0.5, 0.8, 0.81, 1.0, 1.2, 1.21, 1.8, 1.81, 3.0]
+
+    def test_volume_batch_matches_scalar(self, cfg: VPAConfig) -> None:
+        assert classify_volume_batch(self.VALUES, cfg) == [classify_volume(v, cfg) for v in self.VALUES]
+
+    def test_spread_batch_matches_scalar(self, cfg: VPAConfig) -> None:
+        assert classify_spread_batch(self.VALUES, cfg) == [classify_spread(v, cfg) for v in self.VALUES]
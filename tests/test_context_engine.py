@@ -10,7 +10,7 @@ import pytest
 
 from config.vpa_config import load_vpa_config
 from vpa_core.contracts import Bar, Congestion, DominantAlignment, Trend, TrendLocation, TrendStrength, VolumeTrend
-from vpa_core.context_engine import analyze
+from vpa_core.context_engine import ContextTracker, analyze
 
 
 def _ts(day: int) -> datetime:
@@ -344,3 +344,34 @@ class TestVolumeTrend:
         ]
         ctx = analyze(bars, cfg, "15m")
         assert ctx.volume_trend == VolumeTrend.RISING
+
+
+# ---------------------------------------------------------------------------
+# Incremental tracker
+# ---------------------------------------------------------------------------
+
+
+class TestContextTracker:
+    def test_empty_tracker_is_unknown(self, cfg):
+        tracker = ContextTracker(cfg, "15m")
+        assert tracker.snapshot() == analyze([], cfg, "15m")
+
+    @pytest.mark.parametrize("seed", [0, 1, 2, 3])
+    def test_matches_analyze_bar_by_bar(self, cfg, seed):
+        import random
+
+        rng = random.Random(seed)
+        tracker = ContextTracker(cfg, "15m")
+        bars: list[Bar] = []
+        price = 100.0
+        for day in range(1, 91):
+            o = price
+            c = round(price + rng.choice([-1, 0, 1]) * rng.random(), 2)
+            price = c
+            h = max(o, c) + rng.choice([0.0, 0.25, 0.5])
+            l = min(o, c) - rng.choice([0.0, 0.25, 0.5])
+            bar = Bar(o, h, l, c, rng.choice([900_000, 1_000_000, 1_200_000]),
+                      datetime(2024, 1, 1, tzinfo=timezone.utc), "SPY", day)
+            bars.append(bar)
+            tracker.update(bar)
+            assert tracker.snapshot() == analyze(bars, cfg, "15m")
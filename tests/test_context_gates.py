@@ -18,7 +18,7 @@ from vpa_core.contracts import (
     TrendLocation,
     TrendStrength,
 )
-from vpa_core.context_gates import GateResult, apply_gates
+from vpa_core.context_gates import GateResult, apply_gates, block_key
 
 
 TS = datetime(2026, 2, 17, 14, 30, tzinfo=timezone.utc)
@@ -539,3 +539,34 @@ class TestCTX2WithDailyContext:
         result = apply_gates([_bullish_signal()], context, cfg, daily_context=daily)
 
         assert len(result.actionable) == 1
+
+
+# ---------------------------------------------------------------------------
+# Block reason keys
+# ---------------------------------------------------------------------------
+
+
+class TestBlockKey:
+    def test_reasons_keyed_by_block_key(self, cfg: VPAConfig) -> None:
+        signals = [_signal(rule_id="ANOM-1"), _signal(rule_id="ANOM-2")]
+        result = apply_gates(signals, _context(trend_location=TrendLocation.UNKNOWN), cfg)
+
+        assert list(result.block_reasons) == [block_key(s) for s in signals]
+        assert block_key(signals[0]) == f"ANOM-1@{TS.isoformat()}"
+
+
+class TestFastPath:
+    def test_no_gate_can_fire_passes_everything_through(self, cfg: VPAConfig) -> None:
+        signals = [_signal(rule_id="ANOM-1"), _signal(rule_id="VAL-1", requires_gate=False)]
+        result = apply_gates(signals, _context(), cfg)
+
+        assert result.actionable == signals
+        assert result.actionable is not signals
+        assert result.blocked == [] and result.block_reasons == {}
+
+    def test_ungated_signals_pass_even_when_gates_would_fire(self, cfg: VPAConfig) -> None:
+        signals = [_signal(requires_gate=False)]
+        result = apply_gates(signals, _context(trend_location=TrendLocation.UNKNOWN), cfg)
+
+        assert result.actionable == signals
+        assert result.blocked == []
@@ -109,6 +109,19 @@ class TestComputeDailyContext:
         ctx = compute_daily_context(_uptrend_bars(30), _cfg())
         assert ctx.trend_strength in (TrendStrength.STRONG, TrendStrength.MODERATE)
 
+    def test_repeat_call_reuses_snapshot(self) -> None:
+        bars = _uptrend_bars()
+        first = compute_daily_context(bars, _cfg())
+        assert compute_daily_context(list(bars), _cfg()) is first
+
+    def test_new_daily_bar_recomputes(self) -> None:
+        bars = _uptrend_bars()
+        first = compute_daily_context(bars, _cfg())
+        reversed_day = _daily_bar(len(bars) + 1, bars[-1].close - 40.0)
+        ctx = compute_daily_context(bars + [reversed_day], _cfg())
+        assert ctx is not first
+        assert ctx.trend_location != TrendLocation.TOP
+
 
 # --- compute_dominant_alignment ---
 
@@ -185,6 +198,15 @@ class TestEnrichContextWithDaily:
         assert enriched.trend_location == intraday.trend_location
         assert enriched.congestion == intraday.congestion
 
+    def test_preserves_volume_trend(self) -> None:
+        from dataclasses import replace
+        from vpa_core.contracts import VolumeTrend
+
+        daily_ctx = compute_daily_context(_uptrend_bars(), _cfg())
+        intraday = replace(_intraday_context(), volume_trend=VolumeTrend.RISING)
+        enriched = enrich_context_with_daily(intraday, daily_ctx, "BULLISH")
+        assert enriched.volume_trend == VolumeTrend.RISING
+
     def test_unknown_daily_preserves_unknown_alignment(self) -> None:
         daily_ctx = compute_daily_context([], _cfg())
         intraday = _intraday_context()
@@ -33,6 +33,27 @@ def test_bar_store_write_and_get() -> None:
         os.unlink(path)
 
 
+def test_get_bars_since_until_limit() -> None:
+    """Each optional filter of get_bars narrows the result independently."""
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        path = f.name
+    try:
+        store = BarStore(path)
+        bars = [
+            Bar(100.0 + i, 101.0 + i, 99.0 + i, 100.5 + i, 1_000_000, _ts(2024, 1, 2 + i), "SPY")
+            for i in range(6)
+        ]
+        store.write_bars("SPY", "15m", bars)
+        assert [b.timestamp.day for b in store.get_bars("SPY", "15m", since=_ts(2024, 1, 5))] == [5, 6, 7]
+        assert [b.timestamp.day for b in store.get_bars("SPY", "15m", until=_ts(2024, 1, 3))] == [2, 3]
+        assert [b.timestamp.day for b in store.get_bars("SPY", "15m", limit=2)] == [2, 3]
+        out = store.get_bars("SPY", "15m", since=_ts(2024, 1, 3), until=_ts(2024, 1, 6), limit=3)
+        assert [b.timestamp.day for b in out] == [3, 4, 5]
+    finally:
+        import os
+        os.unlink(path)
+
+
 def test_get_last_bars() -> None:
     with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
         path = f.name
@@ -52,6 +73,26 @@ def test_get_last_bars() -> None:
         os.unlink(path)
 
 
+def test_get_last_bars_until_ascending_with_index() -> None:
+    """get_last_bars honours `until`, returns ascending time and re-indexes from 0."""
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        path = f.name
+    try:
+        store = BarStore(path)
+        bars = [
+            Bar(100.0 + i, 101.0 + i, 99.0 + i, 100.5 + i, 1_000_000, _ts(2024, 1, 2 + i), "SPY")
+            for i in range(6)
+        ]
+        store.write_bars("SPY", "15m", bars)
+        out = store.get_last_bars("SPY", "15m", 3, until=_ts(2024, 1, 6))
+        assert [b.timestamp.day for b in out] == [4, 5, 6]
+        assert [b.bar_index for b in out] == [0, 1, 2]
+        assert all(b.timestamp.tzinfo is not None for b in out)
+    finally:
+        import os
+        os.unlink(path)
+
+
 def test_count_bars() -> None:
     with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
         path = f.name
@@ -160,3 +201,23 @@ def test_get_context_window() -> None:
     finally:
         import os
         os.unlink(path)
+
+
+def test_get_context_window_end_time_z_suffix() -> None:
+    """end_time accepts a trailing Z and naive ISO strings, both as UTC."""
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        path = f.name
+    try:
+        store = BarStore(path)
+        bars = [
+            Bar(100.0 + i, 101.0 + i, 99.0 + i, 100.5 + i, 1_000_000, _ts(2024, 1, 2 + i), "SPY")
+            for i in range(5)
+        ]
+        store.write_bars("SPY", "15m", bars)
+        for end_time in ("2024-01-04T09:30:00Z", "2024-01-04T09:30:00"):
+            window = get_context_window(store, "SPY", "15m", window_size=10, end_time=end_time)
+            assert window is not None
+            assert [b.timestamp.day for b in window.bars] == [2, 3, 4]
+    finally:
+        import os
+        os.unlink(path)
@@ -61,3 +61,119 @@ def test_paper_executor_rejects_second_position() -> None:
     finally:
         import os
         os.unlink(path)
+
+
+def test_paper_executor_uses_wal_journal() -> None:
+    import sqlite3
+
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        path = f.name
+    try:
+        PaperExecutor(path, initial_cash=100_000.0)
+        with sqlite3.connect(path) as c:
+            mode = c.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+    finally:
+        import os
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.unlink(path + suffix)
+
+
+def test_paper_executor_in_memory_keeps_state_across_calls() -> None:
+    """One shared connection: an in-memory state survives between calls."""
+    ex = PaperExecutor(":memory:", initial_cash=50_000.0)
+    try:
+        plan = TradePlan(
+            signal_id="sig1",
+            setup_type="no_demand",
+            direction="long",
+            entry_condition="next_bar_open",
+            stop_level=99.0,
+            invalidation_rules=[],
+            rationale="Test",
+            rulebook_ref="no_demand",
+        )
+        order = ex.submit("SPY", plan, current_price=100.0)
+        assert order is not None
+        assert ex.get_position("SPY") is not None
+        assert ex._get_cash() < 50_000.0
+    finally:
+        ex.close()
+
+
+def test_paper_executor_write_rolls_back_on_error() -> None:
+    ex = PaperExecutor(":memory:", initial_cash=100_000.0)
+    try:
+        with pytest.raises(RuntimeError):
+            with ex._write() as c:
+                c.execute("UPDATE cash SET balance = 0 WHERE id = 1")
+                raise RuntimeError("boom")
+        assert ex._get_cash() == 100_000.0
+    finally:
+        ex.close()
+
+
+def test_list_fills_uses_index() -> None:
+    ex = PaperExecutor(":memory:")
+    try:
+        with ex._conn() as c:
+            by_symbol = c.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM fills WHERE symbol = ? ORDER BY ts_utc DESC LIMIT ?",
+                ("SPY", 5),
+            ).fetchall()
+            all_fills = c.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM fills ORDER BY ts_utc DESC LIMIT ?", (5,)
+            ).fetchall()
+        assert any("idx_fills_symbol_ts" in row[-1] for row in by_symbol)
+        assert not any("TEMP B-TREE" in row[-1] for row in by_symbol)
+        assert any("idx_fills_ts" in row[-1] for row in all_fills)
+    finally:
+        ex.close()
+
+
+def test_legacy_iso_timestamps_are_migrated() -> None:
+    """State files from the ISO-text schema are rebuilt with epoch-microsecond columns."""
+    import os
+    import sqlite3
+
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        path = f.name
+    try:
+        with sqlite3.connect(path) as c:
+            c.execute(
+                "CREATE TABLE fills (id TEXT PRIMARY KEY, order_id TEXT NOT NULL, symbol TEXT NOT NULL, "
+                "side TEXT NOT NULL, qty REAL NOT NULL, price REAL NOT NULL, ts_utc TEXT NOT NULL, slippage_bps REAL)"
+            )
+            c.execute(
+                "INSERT INTO fills VALUES ('f1', 'o1', 'SPY', 'buy', 10, 100.05, '2024-01-02T14:30:00.123456+00:00', 5.0)"
+            )
+        ex = PaperExecutor(path)
+        try:
+            fills = ex.list_fills(symbol="SPY")
+            assert len(fills) == 1
+            assert fills[0].timestamp == datetime(2024, 1, 2, 14, 30, 0, 123456, tzinfo=timezone.utc)
+            with ex._conn() as c:
+                assert c.execute("SELECT typeof(ts_utc) FROM fills").fetchone()[0] == "integer"
+        finally:
+            ex.close()
+    finally:
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.unlink(path + suffix)
+
+
+def test_paper_ids_unique_and_uuid_opt_in() -> None:
+    import uuid
+
+    fast = PaperExecutor(":memory:")
+    other = PaperExecutor(":memory:")
+    legacy = PaperExecutor(":memory:", uuid_ids=True)
+    try:
+        ids = {fast._new_id() for _ in range(1000)} | {other._new_id() for _ in range(1000)}
+        assert len(ids) == 2000
+        uuid.UUID(legacy._new_id())  # parses as a uuid4 string
+    finally:
+        fast.close()
+        other.close()
+        legacy.close()
@@ -15,7 +15,8 @@ from vpa_core.contracts import (
     SpreadState,
     VolumeState,
 )
-from vpa_core.feature_engine import extract_features
+from vpa_core.barframe import BarFrame
+from vpa_core.feature_engine import extract_features, extract_features_batch
 
 
 # ---------------------------------------------------------------------------
@@ -188,3 +189,31 @@ class TestConfigDriven:
         features = extract_features(bars, cfg, tf="15m")
         # With window=5, avg of last 5 prior bars still = 1000, so vol_rel still 1.8
         assert features.vol_rel == pytest.approx(1.8)
+
+
+# ---------------------------------------------------------------------------
+# Batch extraction
+# ---------------------------------------------------------------------------
+
+
+class TestExtractFeaturesBatch:
+    """extract_features_batch must agree with per-bar extract_features."""
+
+    def test_matches_per_bar_extraction(self, cfg: VPAConfig) -> None:
+        bars = _golden_bars()
+        bars += [
+            _bar(110.0, 111.0, 104.0 + i % 3, 106.0 - i % 4, 700 + 150 * i, offset_minutes=(21 + i) * 15)
+            for i in range(30)
+        ]
+        batch = extract_features_batch(bars, cfg, tf="15m")
+        assert batch == [extract_features(bars[: i + 1], cfg, tf="15m") for i in range(len(bars))]
+
+    def test_empty_input(self, cfg: VPAConfig) -> None:
+        assert extract_features_batch([], cfg, tf="15m") == []
+
+    def test_accepts_bar_frame(self, cfg: VPAConfig) -> None:
+        bars = _golden_bars()
+        frame = BarFrame.from_bars(bars)
+        assert len(frame) == len(bars)
+        assert [frame.bar(i) for i in range(len(frame))] == bars
+        assert extract_features_batch(frame, cfg, tf="15m") == extract_features_batch(bars, cfg, tf="15m")
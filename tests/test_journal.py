@@ -1,7 +1,13 @@
 """Tests for journal writer. Append-only; rationale and rulebook_ref."""
 
 import json
+import math
+import os
+import subprocess
+import sys
 import tempfile
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
@@ -28,3 +34,117 @@ def test_journal_writer_append_only() -> None:
         assert r1["pnl"] == 20.0
     finally:
         path.unlink(missing_ok=True)
+
+
+def test_journal_writer_flush_makes_lines_visible() -> None:
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
+        path = Path(f.name)
+    try:
+        j = JournalWriter(path)
+        j.fill("o1", "SPY", "buy", 10, 100.0, trade_plan_ref="ENTRY-LONG-1")
+        j.flush()
+        lines = path.read_text().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["event"] == "fill"
+        j.close()
+        j.close()  # idempotent
+    finally:
+        path.unlink(missing_ok=True)
+
+
+def test_journal_writer_encodes_datetimes_enums_and_dataclasses() -> None:
+    from vpa_core.contracts import SignalClass
+
+    @dataclass(frozen=True)
+    class _Payload:
+        ts: datetime
+        cls: SignalClass
+        tags: tuple[str, ...]
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
+        path = Path(f.name)
+    try:
+        ts = datetime(2024, 1, 2, 14, 30, tzinfo=timezone.utc)
+        with JournalWriter(path) as j:
+            j.signal("VAL-1", "long", "Validation.", "VAL-1", detail=_Payload(ts, SignalClass.VALIDATION, ("a", "b")))
+        rec = json.loads(path.read_text())
+        assert rec["detail"] == {"ts": "2024-01-02T14:30:00+00:00", "cls": "VALIDATION", "tags": ["a", "b"]}
+    finally:
+        path.unlink(missing_ok=True)
+
+
+def test_journal_writer_orjson_matches_json_fallback(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    orjson = pytest.importorskip("orjson")
+    from journal import writer
+    from vpa_core.contracts import SignalClass
+
+    @dataclass(frozen=True)
+    class _Payload:
+        ts: datetime
+        cls: SignalClass
+        _cache: dict = field(default_factory=dict)
+
+    ts = datetime(2024, 1, 2, 14, 30, 0, 123456, tzinfo=timezone.utc)
+    records = {}
+    for name, encoder in (("orjson", orjson), ("json", None)):
+        monkeypatch.setattr(writer, "orjson", encoder)
+        path = tmp_path / f"{name}.jsonl"
+        with JournalWriter(path) as j:
+            j.signal(
+                "VAL-1", "long", "Validation.", "VAL-1",
+                detail=_Payload(ts, SignalClass.VALIDATION), at=ts, cls=SignalClass.VALIDATION,
+                values=[1.5, float("nan"), float("inf"), float("-inf")],
+            )
+        rec = json.loads(path.read_text())
+        del rec["ts_utc"]
+        records[name] = rec
+    fast, slow = records["orjson"], records["json"]
+    # The one documented difference: orjson writes non-finite floats as null.
+    assert fast.pop("values") == [1.5, None, None, None]
+    values = slow.pop("values")
+    assert values[0] == 1.5 and not any(math.isfinite(v) for v in values[1:])
+    assert fast == slow
+    assert fast["detail"] == {"ts": "2024-01-02T14:30:00.123456+00:00", "cls": "VALIDATION"}
+
+
+def test_journal_writer_keeps_order_across_batches() -> None:
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
+        path = Path(f.name)
+    try:
+        with JournalWriter(path) as j:
+            for i in range(1000):
+                j.invalidation("stop hit", "VAL-1", "VAL-1", seq=i)
+        seqs = [json.loads(line)["seq"] for line in path.read_text().splitlines()]
+        assert seqs == list(range(1000))
+    finally:
+        path.unlink(missing_ok=True)
+
+
+def test_journal_writer_rejects_unencodable_payloads() -> None:
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
+        path = Path(f.name)
+    try:
+        j = JournalWriter(path)
+        with pytest.raises(TypeError):
+            j.signal("VAL-1", "long", "Validation.", "VAL-1", detail=object())
+        j.signal("VAL-1", "long", "Validation.", "VAL-1")
+        j.close()
+        assert len(path.read_text().splitlines()) == 1
+        with pytest.raises(ValueError):
+            j.signal("VAL-1", "long", "Validation.", "VAL-1")
+    finally:
+        path.unlink(missing_ok=True)
+
+
+def test_journal_writer_keeps_every_line_when_never_closed(tmp_path: Path) -> None:
+    path = tmp_path / "journal.jsonl"
+    script = (
+        "import sys\n"
+        "from journal.writer import JournalWriter\n"
+        "j = JournalWriter(sys.argv[1])\n"
+        "for i in range(5000):\n"
+        "    j.signal('VAL-1', 'long', 'Validation.', 'VAL-1', seq=i)\n"
+    )
+    src = Path(__file__).resolve().parents[1] / "src"
+    subprocess.run([sys.executable, "-c", script, str(path)], check=True, timeout=30, env={**os.environ, "PYTHONPATH": str(src)})
+    assert len(path.read_text().splitlines()) == 5000
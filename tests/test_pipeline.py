@@ -26,7 +26,8 @@ from vpa_core.contracts import (
     TrendStrength,
     VolumeState,
 )
-from vpa_core.pipeline import PipelineResult, run_pipeline
+from vpa_core.context_engine import analyze as analyze_context
+from vpa_core.pipeline import PipelineResult, run_pipeline, stream_actionable
 from vpa_core.risk_engine import AccountState
 from vpa_core.setup_composer import SetupComposer, SetupCandidate, SetupMatch, SetupState
 
@@ -263,6 +264,22 @@ class TestMultiBarSequence:
             assert result.intents == []
         assert composer.active_candidates == 0
 
+    def test_atr_skipped_without_matches(self, cfg: VPAConfig, monkeypatch: pytest.MonkeyPatch) -> None:
+        """ATR only feeds stops, so a bar with no setup match never computes it."""
+        import dataclasses
+        import vpa_core.pipeline as pipeline
+
+        def _fail(*args: object, **kwargs: object) -> float:
+            raise AssertionError("compute_atr called without a match")
+
+        monkeypatch.setattr(pipeline, "compute_atr", _fail)
+        atr_cfg = dataclasses.replace(cfg, atr=dataclasses.replace(cfg.atr, enabled=True))
+        result = run_pipeline(
+            _baseline_bars(20), bar_index=19, context=_context(),
+            account=_account(), config=atr_cfg, composer=SetupComposer(atr_cfg),
+        )
+        assert result.matches == []
+
     def test_pipeline_result_is_frozen(self, cfg: VPAConfig) -> None:
         bars = _baseline_bars(20)
         bars.append(Bar(
@@ -476,3 +493,31 @@ class TestMultiTimeframe:
                               daily_context=daily)
 
         assert len(result.gate_result.blocked) == 0
+
+
+# ---------------------------------------------------------------------------
+# Streaming Features -> Rules -> Gates
+# ---------------------------------------------------------------------------
+
+
+class TestStreamActionable:
+    def test_matches_run_pipeline_actionable(self, cfg: VPAConfig) -> None:
+        bars = _baseline_bars(25)
+        for k, (o, c, vol) in enumerate([(100.0, 104.0, 250_000), (104.0, 103.5, 40_000),
+                                          (103.5, 99.0, 260_000), (99.0, 99.4, 180_000)]):
+            bars.append(Bar(o, max(o, c) + 0.5, min(o, c) - 0.5, c, vol, BASE_TS + timedelta(minutes=15 * (25 + k)), "TEST"))
+        bars += [_baseline_bar(29 + k) for k in range(40)]
+
+        expected = []
+        for i in range(len(bars)):
+            window = bars[: i + 1]
+            result = run_pipeline(
+                window, i, analyze_context(window, cfg, "15m"), _account(), cfg, SetupComposer(cfg),
+            )
+            ids = [s.id for s in result.gate_result.actionable] if result.gate_result else []
+            if ids:
+                expected.append((i, ids))
+
+        streamed = [(i, [s.id for s in sigs]) for i, sigs in stream_actionable(bars, cfg)]
+        assert streamed == expected
+        assert streamed  # the spike bars produce something actionable
@@ -17,7 +17,7 @@ from vpa_core.contracts import (
     SpreadState,
     VolumeState,
 )
-from vpa_core.rule_engine import detect_anom_1, detect_anom_2, detect_avoid_counter_1, detect_avoid_news_1, detect_avoid_trap_1, detect_climax_sell_1, detect_conf_1, detect_conf_2, detect_str_1, detect_test_dem_1, detect_test_sup_1, detect_test_sup_2, detect_trend_anom_1, detect_trend_anom_2, detect_trend_val_1, detect_val_1, detect_weak_1, detect_weak_2, evaluate_avoidance_rules, evaluate_cluster_rules, evaluate_rules, evaluate_trend_rules
+from vpa_core.rule_engine import detect_anom_1, detect_anom_2, detect_avoid_counter_1, detect_avoid_news_1, detect_avoid_trap_1, detect_climax_sell_1, detect_climax_sell_2, detect_conf_1, detect_conf_2, detect_str_1, detect_test_dem_1, detect_test_sup_1, detect_test_sup_2, detect_trend_anom_1, detect_trend_anom_2, detect_trend_val_1, detect_val_1, detect_val_2, detect_weak_1, detect_weak_2, evaluate_avoidance_rules, evaluate_cluster_rules, evaluate_rules, evaluate_rules_batch, evaluate_trend_rules, wick_pattern_masks
 
 
 TS = datetime(2026, 2, 17, 14, 30, tzinfo=timezone.utc)
@@ -1046,6 +1046,77 @@ class TestEvaluateRules:
         assert "VAL-1" not in anom2_ids
 
 
+class TestEvaluateRulesBatch:
+    def test_matches_per_bar_evaluation(self, cfg: VPAConfig) -> None:
+        """Each element equals evaluate_rules on that bar, in the same order."""
+        series = [
+            _features(candle_type=CandleType.DOWN),
+            _features(candle_type=CandleType.UP, spread_state=SpreadState.WIDE, vol_state=VolumeState.HIGH),
+            _features(vol_state=VolumeState.LOW, spread_state=SpreadState.NARROW),
+            _features(lower_wick=7.0, spread_val=2.0, upper_wick=1.0, range_val=10.0),
+            _features(upper_wick=4.0, spread_val=2.0, lower_wick=4.0, range_val=10.0, vol_state=VolumeState.LOW),
+            _features(vol_state=VolumeState.HIGH, spread_state=SpreadState.NARROW),
+            _features(upper_wick=6.0, spread_val=4.0, lower_wick=0.0, range_val=10.0, vol_state=VolumeState.HIGH),
+            _features(upper_wick=3.0, spread_val=1.0, lower_wick=1.0, range_val=5.0, vol_state=VolumeState.LOW),
+            _features(candle_type=CandleType.DOWN),
+        ]
+        batch = evaluate_rules_batch(series, cfg)
+        expected = [evaluate_rules(f, cfg) for f in series]
+        assert [[s.id for s in sigs] for sigs in batch] == [[s.id for s in sigs] for sigs in expected]
+        assert batch == expected
+
+    def test_matches_per_bar_on_nan_and_degenerate_geometry(self, cfg: VPAConfig) -> None:
+        """Comparisons against NaN must fail the same way in the batch gates as in the detectors."""
+        nan = float("nan")
+        series = [
+            _features(upper_wick=nan, spread_val=0.5, lower_wick=1.0, range_val=5.0, vol_state=VolumeState.LOW),
+            _features(upper_wick=3.0, spread_val=nan, lower_wick=1.0, range_val=5.0, vol_state=VolumeState.LOW),
+            _features(upper_wick=3.0, spread_val=1.0, lower_wick=nan, range_val=5.0, vol_state=VolumeState.LOW),
+            _features(lower_wick=nan, spread_val=0.5, upper_wick=nan, range_val=10.0),
+            _features(upper_wick=3.0, spread_val=1.0, lower_wick=1.0, range_val=nan, vol_state=VolumeState.LOW),
+            _features(upper_wick=0.0, spread_val=0.0, lower_wick=0.0, range_val=0.0, vol_state=VolumeState.LOW),
+            _features(upper_wick=3.0, spread_val=1.0, lower_wick=1.0, range_val=-5.0, vol_state=VolumeState.LOW),
+        ]
+        batch = evaluate_rules_batch(series, cfg)
+        expected = [evaluate_rules(f, cfg) for f in series]
+        assert [[s.id for s in sigs] for sigs in batch] == [[s.id for s in sigs] for sigs in expected]
+        assert "TEST-DEM-1" in [s.id for s in expected[0]]
+
+    def test_empty_series(self, cfg: VPAConfig) -> None:
+        assert evaluate_rules_batch([], cfg) == []
+
+    def test_wick_pattern_masks_match_detectors(self, cfg: VPAConfig) -> None:
+        series = [
+            _features(lower_wick=7.0, spread_val=2.0, upper_wick=1.0, range_val=10.0),
+            _features(upper_wick=7.0, spread_val=2.0, lower_wick=1.0, range_val=10.0),
+            _features(upper_wick=1.0, spread_val=8.0, lower_wick=1.0, range_val=10.0),
+            _features(upper_wick=0.0, spread_val=0.0, lower_wick=0.0, range_val=0.0),
+        ]
+        hammer, star = wick_pattern_masks(series, cfg)
+        assert hammer == [detect_str_1(f, cfg) is not None for f in series]
+        assert star == [detect_weak_1(f, cfg) is not None for f in series]
+        assert hammer == [True, False, False, False]
+        assert star == [False, True, False, False]
+
+    def test_state_dispatch_matches_every_detector(self, cfg: VPAConfig) -> None:
+        """For every state triple, dispatch fires exactly what the detectors do."""
+        detectors = [
+            detect_val_1, detect_val_2, detect_anom_1, detect_anom_2, detect_str_1,
+            detect_weak_1, detect_weak_2, detect_climax_sell_1, detect_climax_sell_2,
+            detect_conf_1, detect_avoid_news_1, detect_test_sup_1, detect_test_sup_2,
+            detect_test_dem_1,
+        ]
+        for candle_type in CandleType:
+            for spread_state in SpreadState:
+                for vol_state in VolumeState:
+                    f = _features(
+                        candle_type=candle_type, spread_state=spread_state, vol_state=vol_state,
+                        upper_wick=4.0, spread_val=1.0, lower_wick=5.0, range_val=10.0,
+                    )
+                    expected = [s for s in (d(f, cfg) for d in detectors) if s is not None]
+                    assert evaluate_rules(f, cfg) == expected
+
+
 # ---------------------------------------------------------------------------
 # Trend-level rules: TREND-VAL-1 and TREND-ANOM-1
 # ---------------------------------------------------------------------------
@@ -1187,6 +1258,12 @@ class TestTRENDVAL1andANOM1MutualExclusion:
         signals = evaluate_trend_rules(ctx, cfg)
         assert signals == []
 
+    def test_injected_now_stamps_signals(self, cfg: VPAConfig) -> None:
+        ctx = _context(trend=Trend.UP, volume_trend=VolumeTrend.RISING)
+        signals = evaluate_trend_rules(ctx, cfg, now=TS)
+        assert signals
+        assert all(s.ts == TS for s in signals)
+
 
 # ---------------------------------------------------------------------------
 # TREND-ANOM-2: sequential anomaly cluster (multi-bar)
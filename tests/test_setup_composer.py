@@ -151,6 +151,7 @@ class TestEntryLong1Complete:
         assert len(matches[0].signals) == 2
         assert matches[0].signals[0].id == "TEST-SUP-1"
         assert matches[0].signals[1].id == "VAL-1"
+        assert matches[0].signal_ids == ("TEST-SUP-1", "VAL-1")
         assert matches[0].matched_at_bar == 1
 
     def test_delayed_follow_within_window(self, composer: SetupComposer, cfg: VPAConfig) -> None:
@@ -4,9 +4,11 @@ from datetime import datetime, timezone
 
 import pytest
 
+from vpa_core.barframe import BarFrame, anatomy
 from vpa_core.contracts import Bar, RelativeVolume
 from vpa_core.features import bar_range, body, close_location, lower_wick, spread, upper_wick
 from vpa_core.relative_volume import (
+    RollingVolume,
     average_volume,
     classify_relative_volume,
     relative_volume_for_bar,
@@ -71,6 +73,22 @@ def test_close_location_middle() -> None:
     assert close_location(bar) == "middle"
 
 
+def test_anatomy_columns_match_per_bar_features() -> None:
+    """BarFrame anatomy columns equal the per-Bar feature functions."""
+    ts = datetime.now(timezone.utc)
+    bars = [
+        Bar(100.0, 105.0, 99.0, 104.0, 1000, ts, "SPY"),
+        Bar(104.0, 104.5, 98.0, 98.5, 1200, ts, "SPY"),
+        Bar(98.5, 98.5, 98.5, 98.5, 800, ts, "SPY"),
+    ]
+    cols = anatomy(BarFrame.from_bars(bars))
+    assert cols.spread == [spread(b) for b in bars]
+    assert cols.range == [bar_range(b) for b in bars]
+    assert cols.upper_wick == [upper_wick(b) for b in bars]
+    assert cols.lower_wick == [lower_wick(b) for b in bars]
+    assert cols.close_location == [close_location(b) for b in bars]
+
+
 def test_classify_relative_volume() -> None:
     assert classify_relative_volume(120, 100.0) == RelativeVolume.HIGH
     assert classify_relative_volume(80, 100.0) == RelativeVolume.LOW
@@ -87,6 +105,18 @@ def test_average_volume() -> None:
     assert average_volume(bars, lookback=2) == 150.0  # (100+200)/2 for bars before last
 
 
+def test_rolling_volume_matches_average_volume() -> None:
+    """RollingVolume.average() before push equals average_volume on the prefix."""
+    ts = datetime.now(timezone.utc)
+    volumes = [100, 250, 175, 400, 90, 310, 120]
+    rolling = RollingVolume(lookback=3)
+    bars: list[Bar] = []
+    for v in volumes:
+        bars.append(Bar(100.0, 101.0, 99.0, 100.5, v, ts, "SPY"))
+        assert rolling.average() == average_volume(bars, lookback=3)
+        rolling.push(v)
+
+
 def test_relative_volume_for_bar_low(no_demand_bar_sequence: list[Bar]) -> None:
     rv = relative_volume_for_bar(no_demand_bar_sequence)
     assert rv == RelativeVolume.LOW